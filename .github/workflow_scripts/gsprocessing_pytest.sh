@@ -1,4 +1,4 @@
 cd /usr/lib/spark/graphstorm/graphstorm-processing/
-pip install .
-python3 -m pytest .
+pip install . pytest-xdist
+python3 -m pytest -n auto --dist loadscope .
 
@@ -474,11 +474,9 @@ class DistributedExecutor:
                     for type_feat_dict in input_dict["features"]:
                         # We take a feature's name either explicitly if it exists,
                         # or from the column name otherwise.
-                        feat_name = (
-                            type_feat_dict["name"]
-                            if "name" in type_feat_dict
-                            else type_feat_dict["column"]
-                        )
+                        feat_name = type_feat_dict.get("name")
+                        if feat_name is None:
+                            feat_name = type_feat_dict["column"]
                         if feat_name in type_transforms:
                             # Feature representation needs to contain all the
                             # necessary information to re-apply the feature transformation
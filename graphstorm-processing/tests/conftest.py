@@ -17,6 +17,7 @@ limitations under the License.
 import os
 import sys
 import logging
+import shutil
 import tempfile
 from typing import Iterator
 
@@ -32,6 +33,9 @@ os.environ["MODEL_PATH"] = "./.pretrain/models"
 os.environ["DEPLOYMENT_STAGE"] = "dev"
 
 _ROOT = os.path.abspath(os.path.dirname(__file__))
+# Set by pytest-xdist to gw0, gw1, ... in worker processes when running with -n
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+_OUTPUT_ROOT = os.path.join(_ROOT, "resources/test_output/")
 
 
 def in_docker():
@@ -57,24 +61,45 @@ def temp_output_root():
     under the directory, will raise an OSError if the directory
     is not empty at the end of testing.
     """
-    yield os.mkdir(os.path.join(_ROOT, "resources/test_output/"))
-    os.rmdir(os.path.join(_ROOT, "resources/test_output/"))
+    if _XDIST_WORKER is None:
+        yield os.mkdir(_OUTPUT_ROOT)
+        os.rmdir(_OUTPUT_ROOT)
+    else:
+        # With pytest-xdist every worker shares the output root. A worker can't
+        # tell whether the others still use it, so the controller removes it
+        # in pytest_sessionfinish once all workers are done.
+        yield os.makedirs(_OUTPUT_ROOT, exist_ok=True)
+
+
+def pytest_sessionfinish(session):
+    """Remove the output root shared by the pytest-xdist workers."""
+    # Only the controller process, which has no workerinput, removes it.
+    if not hasattr(session.config, "workerinput") and os.path.isdir(_OUTPUT_ROOT):
+        os.rmdir(_OUTPUT_ROOT)
 
 
 @pytest.fixture(scope="session", name="spark")
 def spark_fixture() -> Iterator[SparkSession]:
-    """Create the main SparkContext we use throughout the tests"""
+    """Create the main SparkContext we use throughout the tests.
+
+    When running under pytest-xdist each worker gets its own SparkSession
+    with a separate scratch directory.
+    """
+    worker_id = _XDIST_WORKER or "master"
+    spark_local_dir = tempfile.mkdtemp(prefix=f"spark-{worker_id}-")
     spark_context = (
         SparkSession.builder.master("local[4]")
-        .appName("local-testing-pyspark-context")
+        .appName(f"local-testing-pyspark-context-{worker_id}")
         .config("spark.sql.catalogImplementation", "in-memory")
         .config("spark.sql.shuffle.partitions", "1")
+        .config("spark.local.dir", spark_local_dir)
         .getOrCreate()
     )
     suppress_py4j_logging()
     yield spark_context
 
     spark_context.stop()
+    shutil.rmtree(spark_local_dir, ignore_errors=True)
 
 
 @pytest.fixture(scope="session")
@@ -14,10 +14,12 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import functools
+import hashlib
 import json
 import os
 import shutil
-import tempfile
+from typing import NamedTuple
 from unittest import mock
 
 import pytest
@@ -28,16 +30,50 @@ from test_dist_heterogenous_loader import verify_integ_test_output, NODE_CLASS_G
 
 pytestmark = pytest.mark.usefixtures("spark")
 _ROOT = os.path.abspath(os.path.dirname(__file__))
+_INPUT_PATH = os.path.join(_ROOT, "resources/small_heterogeneous_graph")
+_CONFIG_FILENAME = "gsprocessing-config.json"
 
 
-@pytest.fixture(autouse=True, name="tempdir")
-def tempdir_fixture():
-    """Create temp dir for output files"""
-    tempdirectory = tempfile.mkdtemp(
-        prefix=os.path.join(_ROOT, "resources/test_output/"),
-    )
-    yield tempdirectory
-    shutil.rmtree(tempdirectory)
+@functools.lru_cache(maxsize=None)
+def _load_json(path: str, mtime_ns: int) -> dict:
+    """Parse a JSON file, memoized on its path and modification time"""
+    del mtime_ns  # Only used as part of the cache key
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session", name="json_cache")
+def json_cache_fixture():
+    """Return a JSON loader that only re-parses files that changed on disk.
+
+    The returned dicts are shared between callers and must not be mutated.
+    """
+
+    def load(path: str) -> dict:
+        abs_path = os.path.abspath(path)
+        return _load_json(abs_path, os.stat(abs_path).st_mtime_ns)
+
+    return load
+
+
+def _file_digest(path: str) -> str:
+    """Return the SHA-256 hex digest of a file's raw bytes"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def assert_json_files_equal(path_a: str, path_b: str, json_cache) -> None:
+    """Assert two JSON files hold the same content.
+
+    Byte-identical files are accepted without parsing, otherwise the parsed
+    contents are compared, as formatting can differ between writers.
+    """
+    if _file_digest(path_a) == _file_digest(path_b):
+        return
+    assert json_cache(path_a) == json_cache(path_b)
 
 
 def precomp_json_file(local_input, precomp_filename):
@@ -49,29 +85,15 @@ def precomp_json_file(local_input, precomp_filename):
     return precomp_file
 
 
-@pytest.fixture(name="user_state_categorical_precomp_file")
-def user_state_categorical_precomp_file_fixture():
-    """Copy precomputed user->state feature transformation to local input dir"""
-    precomp_file = precomp_json_file(
-        os.path.join(_ROOT, "resources/small_heterogeneous_graph"),
-        "user_state_categorical_transformation.json",
-    )
-
-    yield precomp_file
-
-    os.remove(precomp_file)
-
-
-def test_dist_executor_run_with_precomputed(tempdir: str, user_state_categorical_precomp_file):
-    """Test run function with local data"""
-    input_path = os.path.join(_ROOT, "resources/small_heterogeneous_graph")
-    executor_configuration = ExecutorConfig(
-        local_config_path=input_path,
-        local_metadata_output_path=tempdir,
-        input_prefix=input_path,
-        output_prefix=tempdir,
+def make_executor_config(output_dir: str, config_dir: str = _INPUT_PATH) -> ExecutorConfig:
+    """Create an executor configuration for the small heterogeneous graph"""
+    return ExecutorConfig(
+        local_config_path=config_dir,
+        local_metadata_output_path=output_dir,
+        input_prefix=_INPUT_PATH,
+        output_prefix=output_dir,
         num_output_files=-1,
-        config_filename="gsprocessing-config.json",
+        config_filename=_CONFIG_FILENAME,
         execution_env=ExecutionEnv.LOCAL,
         filesystem_type=FilesystemType.LOCAL,
         add_reverse_edges=True,
@@ -79,12 +101,45 @@ def test_dist_executor_run_with_precomputed(tempdir: str, user_state_categorical
         do_repartition=True,
     )
 
-    original_precomp_file = user_state_categorical_precomp_file
 
-    with open(original_precomp_file, "r", encoding="utf-8") as f:
-        original_transformations = json.load(f)
+@pytest.fixture(scope="module", name="user_state_categorical_precomp_file")
+def user_state_categorical_precomp_file_fixture(tmp_path_factory):
+    """Copy the graph config and precomputed user->state feature transformation
+    into a temporary config dir, cleaned up by pytest"""
+    config_dir = str(tmp_path_factory.mktemp("precomp"))
+    shutil.copy(
+        os.path.join(_INPUT_PATH, _CONFIG_FILENAME), os.path.join(config_dir, _CONFIG_FILENAME)
+    )
+    precomp_file = precomp_json_file(
+        config_dir,
+        "user_state_categorical_transformation.json",
+    )
 
-    dist_executor = DistributedExecutor(executor_configuration)
+    return precomp_file
+
+
+class ExecutedDistExecutor(NamedTuple):
+    """Outputs of a completed DistributedExecutor run"""
+
+    executor: DistributedExecutor
+    metadata: dict
+    output_dir: str
+
+
+@pytest.fixture(scope="module", name="executed_dist_executor")
+def executed_dist_executor_fixture(
+    spark, tmp_path_factory, user_state_categorical_precomp_file, json_cache
+):  # pylint: disable=unused-argument
+    """Run the DistributedExecutor once with precomputed transformations.
+
+    Yields the executor that has completed its run, its parsed output metadata
+    and the output directory. Tests using this fixture should only read from
+    its outputs.
+    """
+    output_dir = str(tmp_path_factory.mktemp("dist_executor"))
+    config_dir = os.path.dirname(user_state_categorical_precomp_file)
+
+    dist_executor = DistributedExecutor(make_executor_config(output_dir, config_dir))
 
     # Mock the SparkContext stop() function to leave the Spark context running
     # for the other tests, otherwise dist_executor stops it
@@ -92,38 +147,32 @@ def test_dist_executor_run_with_precomputed(tempdir: str, user_state_categorical
 
     dist_executor.run()
 
-    with open(os.path.join(tempdir, "metadata.json"), "r", encoding="utf-8") as mfile:
-        metadata = json.load(mfile)
+    metadata = json_cache(os.path.join(output_dir, "metadata.json"))
 
-    verify_integ_test_output(metadata, dist_executor.loader, NODE_CLASS_GRAPHINFO_UPDATES)
+    yield ExecutedDistExecutor(dist_executor, metadata, output_dir)
+
+
+def test_dist_executor_run_with_precomputed(
+    executed_dist_executor, user_state_categorical_precomp_file, json_cache
+):
+    """Test run function with local data"""
+    dist_executor, metadata, output_dir = executed_dist_executor
 
-    with open(os.path.join(tempdir, TRANSFORMATIONS_FILENAME), "r", encoding="utf-8") as f:
-        reapplied_transformations = json.load(f)
+    verify_integ_test_output(metadata, dist_executor.loader, NODE_CLASS_GRAPHINFO_UPDATES)
 
     # There should be no difference between original and re-applied transformation dicts
-    assert reapplied_transformations == original_transformations
+    assert_json_files_equal(
+        user_state_categorical_precomp_file,
+        os.path.join(output_dir, TRANSFORMATIONS_FILENAME),
+        json_cache,
+    )
 
     # TODO: Verify other metadata files that verify_integ_test_output doesn't check for
 
 
-def test_merge_input_and_transform_dicts(tempdir: str):
+def test_merge_input_and_transform_dicts(tmp_path):
     """Test the _merge_config_with_transformations function with hardcoded json data"""
-    input_path = os.path.join(_ROOT, "resources/small_heterogeneous_graph")
-    executor_configuration = ExecutorConfig(
-        local_config_path=input_path,
-        local_metadata_output_path=tempdir,
-        input_prefix=input_path,
-        output_prefix=tempdir,
-        num_output_files=-1,
-        config_filename="gsprocessing-config.json",
-        execution_env=ExecutionEnv.LOCAL,
-        filesystem_type=FilesystemType.LOCAL,
-        add_reverse_edges=True,
-        graph_name="small_heterogeneous_graph",
-        do_repartition=True,
-    )
-
-    dist_executor = DistributedExecutor(executor_configuration)
+    dist_executor = DistributedExecutor(make_executor_config(str(tmp_path)))
 
     pre_comp_transormations = {
         "node_features": {
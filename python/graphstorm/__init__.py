@@ -17,23 +17,54 @@
 """
 __version__ = "0.3"
 
-from . import gsf
-from . import utils
-from .utils import get_rank, get_world_size
-from .gsf import initialize, get_node_feat_size
-from .gsf import create_builtin_node_gnn_model
-from .gsf import create_builtin_edge_gnn_model
-from .gsf import create_builtin_task_tracker
-from .gsf import create_builtin_lp_gnn_model
-from .gsf import create_builtin_lp_model
-from .gsf import create_builtin_edge_model
-from .gsf import create_builtin_node_model
-from .gsf import (create_task_decoder,
-                  create_evaluator)
-
-from .gsf import (create_builtin_node_decoder,
-                  create_builtin_edge_decoder,
-                  create_builtin_lp_decoder,
-                  create_builtin_reconstruct_nfeat_decoder)
-from .gsf import (get_builtin_lp_train_dataloader_class,
-                  get_builtin_lp_eval_dataloader_class)
+import importlib
+
+# Public API re-exported from submodules. They are imported lazily on first
+# access (PEP 562) so that ``import graphstorm`` does not pull in torch and DGL
+# for tools that only need e.g. the version string.
+_LAZY_ATTRS = {
+    "get_rank": "utils",
+    "get_world_size": "utils",
+    "initialize": "gsf",
+    "get_node_feat_size": "gsf",
+    "create_builtin_node_gnn_model": "gsf",
+    "create_builtin_edge_gnn_model": "gsf",
+    "create_builtin_task_tracker": "gsf",
+    "create_builtin_lp_gnn_model": "gsf",
+    "create_builtin_lp_model": "gsf",
+    "create_builtin_edge_model": "gsf",
+    "create_builtin_node_model": "gsf",
+    "create_task_decoder": "gsf",
+    "create_evaluator": "gsf",
+    "create_builtin_node_decoder": "gsf",
+    "create_builtin_edge_decoder": "gsf",
+    "create_builtin_lp_decoder": "gsf",
+    "create_builtin_reconstruct_nfeat_decoder": "gsf",
+    "get_builtin_lp_train_dataloader_class": "gsf",
+    "get_builtin_lp_eval_dataloader_class": "gsf",
+}
+
+__all__ = ["gsf", "utils"] + list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    """ Import the public API and submodules of graphstorm on first access.
+    """
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__)
+        value = getattr(module, name)
+    else:
+        try:
+            value = importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as err:
+            if err.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """ List the lazily imported public API together with the loaded attributes.
+    """
+    return sorted(set(globals()) | set(__all__))
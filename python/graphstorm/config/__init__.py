@@ -26,11 +26,11 @@ from .config import (BUILTIN_TASK_NODE_CLASSIFICATION,
                      BUILTIN_TASK_LINK_PREDICTION,
                      BUILTIN_TASK_COMPUTE_EMB,
                      BUILTIN_TASK_RECONSTRUCT_NODE_FEAT)
-from .config import SUPPORTED_TASKS
+from .config import SUPPORTED_TASKS, SUPPORTED_TASKS_SET
 
 from .config import BUILTIN_LP_DOT_DECODER
 from .config import BUILTIN_LP_DISTMULT_DECODER
-from .config import SUPPORTED_LP_DECODER
+from .config import SUPPORTED_LP_DECODER, SUPPORTED_LP_DECODER_SET
 
 from .config import (GRAPHSTORM_MODEL_EMBED_LAYER,
                      GRAPHSTORM_MODEL_GNN_LAYER,
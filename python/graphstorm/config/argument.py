@@ -27,8 +27,8 @@ import torch as th
 import torch.nn.functional as F
 from dgl.distributed.constants import DEFAULT_NTYPE, DEFAULT_ETYPE
 
-from .config import BUILTIN_GNN_ENCODER
-from .config import BUILTIN_ENCODER
+from .config import BUILTIN_GNN_ENCODER_SET
+from .config import BUILTIN_ENCODER, BUILTIN_ENCODER_SET
 from .config import SUPPORTED_BACKEND
 from .config import (BUILTIN_LP_LOSS_FUNCTION,
                      BUILTIN_LP_LOSS_CROSS_ENTROPY,
@@ -47,15 +47,16 @@ from .config import EARLY_STOP_AVERAGE_INCREASE_STRATEGY
 from .config import GRAPHSTORM_SAGEMAKER_TASK_TRACKER
 from .config import SUPPORTED_TASK_TRACKER
 
-from .config import SUPPORTED_TASKS
+from .config import SUPPORTED_TASKS, SUPPORTED_TASKS_SET
 
 from .config import BUILTIN_LP_DISTMULT_DECODER
-from .config import SUPPORTED_LP_DECODER
+from .config import SUPPORTED_LP_DECODER, SUPPORTED_LP_DECODER_SET
 from .config import (GRAPHSTORM_LP_EMB_NORMALIZATION_METHODS,
                      GRAPHSTORM_LP_EMB_L2_NORMALIZATION)
 
 from .config import (GRAPHSTORM_MODEL_ALL_LAYERS, GRAPHSTORM_MODEL_EMBED_LAYER,
-                     GRAPHSTORM_MODEL_DECODER_LAYER, GRAPHSTORM_MODEL_LAYER_OPTIONS)
+                     GRAPHSTORM_MODEL_DECODER_LAYER, GRAPHSTORM_MODEL_LAYER_OPTIONS,
+                     GRAPHSTORM_MODEL_LAYER_OPTIONS_SET)
 from .config import get_mttask_id
 from .config import TaskInfo
 
@@ -735,6 +736,9 @@ class GSConfig:
             _ = self.num_layers
             _ = self.use_self_loop
             _ = self.use_node_embeddings
+            _ = self.sparse_emb_cache_size
+            _ = self.quantize_sparse_emb_cache
+            _ = self.compile_input_proj
             _ = self.num_bases
             _ = self.num_heads
             _ = self.num_ffn_layers_in_gnn
@@ -1112,7 +1116,7 @@ class GSConfig:
         if self.distill_lm_configs is None:
             assert hasattr(self, "_model_encoder_type"), \
                 "Model encoder type should be provided"
-            assert self._model_encoder_type in BUILTIN_ENCODER, \
+            assert self._model_encoder_type in BUILTIN_ENCODER_SET, \
                 f"Model encoder type should be in {BUILTIN_ENCODER}"
             return self._model_encoder_type
         else:
@@ -1234,7 +1238,7 @@ class GSConfig:
         """ training fanout
         """
         # pylint: disable=no-member
-        if self.model_encoder_type in BUILTIN_GNN_ENCODER:
+        if self.model_encoder_type in BUILTIN_GNN_ENCODER_SET:
             assert hasattr(self, "_fanout"), \
                     "Training fanout must be provided"
 
@@ -1329,7 +1333,7 @@ class GSConfig:
         """ Number of GNN layers
         """
         # pylint: disable=no-member
-        if self.model_encoder_type in BUILTIN_GNN_ENCODER:
+        if self.model_encoder_type in BUILTIN_GNN_ENCODER_SET:
             assert hasattr(self, "_num_layers"), \
                 "Number of GNN layers must be provided"
             assert isinstance(self._num_layers, int), \
@@ -1389,7 +1393,7 @@ class GSConfig:
                 "restore-model-path must be provided if restore-model-layers is specified."
             model_layers = self._restore_model_layers.split(',')
             for layer in model_layers:
-                assert layer in GRAPHSTORM_MODEL_LAYER_OPTIONS, \
+                assert layer in GRAPHSTORM_MODEL_LAYER_OPTIONS_SET, \
                     f"{layer} is not supported, must be any of {GRAPHSTORM_MODEL_LAYER_OPTIONS}"
         # GLEM restore layers to the LM component, thus conflicting with all layers:
         # use [GRAPHSTORM_MODEL_EMBED_LAYER, GRAPHSTORM_MODEL_DECODER_LAYER] to restore an LM
@@ -1611,6 +1615,40 @@ class GSConfig:
         # It will make the model transductive
         return False
 
+    @property
+    def sparse_emb_cache_size(self):
+        """ Number of learnable node embedding rows cached on the device of the
+            input layer for each node type to speed up inference.
+        """
+        # pylint: disable=no-member
+        if hasattr(self, "_sparse_emb_cache_size"):
+            assert self._sparse_emb_cache_size >= 0, \
+                "The size of the sparse embedding cache must be larger or equal than 0"
+            return self._sparse_emb_cache_size
+        # By default, do not cache the sparse embeddings
+        return 0
+
+    @property
+    def quantize_sparse_emb_cache(self):
+        """ Whether to store the cached learnable node embeddings in INT8
+        """
+        # pylint: disable=no-member
+        if hasattr(self, "_quantize_sparse_emb_cache"):
+            assert self._quantize_sparse_emb_cache in [True, False]
+            return self._quantize_sparse_emb_cache
+        return False
+
+    @property
+    def compile_input_proj(self):
+        """ Whether to compile the activation and dropout of the input layer
+            with torch.compile
+        """
+        # pylint: disable=no-member
+        if hasattr(self, "_compile_input_proj"):
+            assert self._compile_input_proj in [True, False]
+            return self._compile_input_proj
+        return False
+
     @property
     def construct_feat_ntype(self):
         """ The node types that require to construct node features.
@@ -2231,7 +2269,7 @@ class GSConfig:
         # pylint: disable=no-member
         if hasattr(self, "_lp_decoder_type"):
             decoder_type = self._lp_decoder_type.lower()
-            assert decoder_type in SUPPORTED_LP_DECODER, \
+            assert decoder_type in SUPPORTED_LP_DECODER_SET, \
                 f"Link prediction decoder {self._lp_decoder_type} not supported. " \
                 f"GraphStorm only supports {SUPPORTED_LP_DECODER}"
             return decoder_type
@@ -2527,7 +2565,7 @@ class GSConfig:
         """
         # pylint: disable=no-member
         if hasattr(self, "_task_type"):
-            assert self._task_type in SUPPORTED_TASKS, \
+            assert self._task_type in SUPPORTED_TASKS_SET, \
                     f"Supported task types include {SUPPORTED_TASKS}, " \
                     f"but got {self._task_type}"
             return self._task_type
@@ -2859,6 +2897,20 @@ def _add_hyperparam_args(parser):
             type=lambda x: (str(x).lower() in ['true', '1']),
             default=argparse.SUPPRESS,
             help="Whether to use extra learnable node embeddings")
+    group.add_argument("--sparse-emb-cache-size", type=int, default=argparse.SUPPRESS,
+            help="Number of learnable node embedding rows cached on the device of the "
+                 "input layer for each node type to speed up inference.")
+    group.add_argument(
+            "--quantize-sparse-emb-cache",
+            type=lambda x: (str(x).lower() in ['true', '1']),
+            default=argparse.SUPPRESS,
+            help="Whether to store the cached learnable node embeddings in INT8")
+    group.add_argument(
+            "--compile-input-proj",
+            type=lambda x: (str(x).lower() in ['true', '1']),
+            default=argparse.SUPPRESS,
+            help="Whether to compile the activation and dropout of the input layer "
+                 "with torch.compile")
     group.add_argument("--construct-feat-ntype", type=str, nargs="+",
             help="The node types whose features are constructed from neighbors' features.")
     group.add_argument("--construct-feat-encoder", type=str, default=argparse.SUPPRESS,
@@ -16,10 +16,22 @@
     Builtin configs
 """
 import dataclasses
+import functools
+import sys
 import typing
 
+if typing.TYPE_CHECKING:
+    # Only imported for type annotations, as both modules import this one.
+    from .argument import GSConfig
+    from ..dataloading.dataloading import (GSgnnNodeDataLoaderBase,
+                                           GSgnnEdgeDataLoaderBase,
+                                           GSgnnLinkPredictionDataLoaderBase)
+
 BUILTIN_GNN_ENCODER = ["gat", "rgat", "rgcn", "sage", "hgt", "gatv2"]
 BUILTIN_ENCODER = ["lm", "mlp"] + BUILTIN_GNN_ENCODER
+# Set versions of the lists above for constant time membership checks.
+BUILTIN_GNN_ENCODER_SET = frozenset(BUILTIN_GNN_ENCODER)
+BUILTIN_ENCODER_SET = frozenset(BUILTIN_ENCODER)
 SUPPORTED_BACKEND = ["gloo", "nccl"]
 
 GRAPHSTORM_MODEL_EMBED_LAYER = "embed"
@@ -33,6 +45,7 @@ GRAPHSTORM_MODEL_ALL_LAYERS = [GRAPHSTORM_MODEL_EMBED_LAYER,
 GRAPHSTORM_MODEL_LAYER_OPTIONS = GRAPHSTORM_MODEL_ALL_LAYERS + \
         [GRAPHSTORM_MODEL_DENSE_EMBED_LAYER,
          GRAPHSTORM_MODEL_SPARSE_EMBED_LAYER]
+GRAPHSTORM_MODEL_LAYER_OPTIONS_SET = frozenset(GRAPHSTORM_MODEL_LAYER_OPTIONS)
 
 BUILTIN_LP_LOSS_CROSS_ENTROPY = "cross_entropy"
 BUILTIN_LP_LOSS_LOGSIGMOID_RANKING = "logsigmoid"
@@ -63,6 +76,7 @@ SUPPORTED_TASKS  = [BUILTIN_TASK_NODE_CLASSIFICATION, \
     BUILTIN_TASK_LINK_PREDICTION, \
     BUILTIN_TASK_EDGE_REGRESSION, \
     BUILTIN_TASK_RECONSTRUCT_NODE_FEAT]
+SUPPORTED_TASKS_SET = frozenset(SUPPORTED_TASKS)
 
 EARLY_STOP_CONSECUTIVE_INCREASE_STRATEGY = "consecutive_increase"
 EARLY_STOP_AVERAGE_INCREASE_STRATEGY = "average_increase"
@@ -77,8 +91,12 @@ BUILTIN_LP_DOT_DECODER = "dot_product"
 BUILTIN_LP_DISTMULT_DECODER = "distmult"
 
 SUPPORTED_LP_DECODER = [BUILTIN_LP_DOT_DECODER, BUILTIN_LP_DISTMULT_DECODER]
+SUPPORTED_LP_DECODER_SET = frozenset(SUPPORTED_LP_DECODER)
 
 ################ Task info data classes ############################
+# dataclass(slots=True) is only available since Python 3.10.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 def get_mttask_id(task_type, ntype=None, etype=None, label=None):
     """ Generate task ID for multi-task learning tasks.
         The ID is composed of the task type, the node type
@@ -101,25 +119,41 @@ def get_mttask_id(task_type, ntype=None, etype=None, label=None):
     ------
     str: Task ID.
     """
+    is_etype_list = isinstance(etype, list)
+    if is_etype_list:
+        # Lists are not hashable, convert them into tuples for the cache lookup.
+        etype = tuple(tuple(et) for et in etype)
+    elif etype is not None and not isinstance(etype, (str, tuple)):
+        raise TypeError(f"Unknown etype format: {etype}. Must be a string " \
+                        "or a tuple of strings or a list of tuples of strings.")
+    return _get_mttask_id(task_type, ntype, etype, label, is_etype_list)
+
+@functools.lru_cache(maxsize=1024)
+def _get_mttask_id(task_type, ntype, etype, label, is_etype_list):
+    """ Memoized implementation of get_mttask_id.
+
+        ``etype`` is a string, a tuple or, when ``is_etype_list`` is True,
+        a tuple of edge type tuples.
+    """
     task_id = [task_type]
     if ntype is not None:
         task_id.append(ntype) # node task
     if etype is not None:
-        if isinstance(etype, str):
+        if is_etype_list: # a list of etypes
+            task_id.append("__".join(map("_".join, etype)))
+        elif isinstance(etype, str):
             task_id.append(etype)
-        elif isinstance(etype, tuple):
-            task_id.append("_".join(etype))
-        elif isinstance(etype, list): # a list of etypes
-            task_id.append("__".join(["_".join(et) for et in etype]))
         else:
-            raise TypeError(f"Unknown etype format: {etype}. Must be a string " \
-                            "or a tuple of strings or a list of tuples of strings.")
+            task_id.append("_".join(etype))
     if label is not None:
         task_id.append(label)
 
-    return "-".join(task_id)
+    # Task IDs are built at runtime but used as dictionary keys for every
+    # mini-batch, interning them lets comparisons short-cut on identity.
+    return sys.intern("-".join(task_id))
 
-@dataclasses.dataclass
+# TaskInfo is not frozen as the dataloader is attached after construction.
+@dataclasses.dataclass(**_DATACLASS_SLOTS)
 class TaskInfo:
     """Information of a training task in multi-task learning
 
@@ -129,6 +163,8 @@ class TaskInfo:
         Task type.
     task_id: str
         Task id. Unique id for each task.
+    task_config: GSConfig
+        Task specific configuration.
     batch_size: int
         Batch size of the current task.
     mask_fields: list
@@ -142,5 +178,7 @@ class TaskInfo:
     """
     task_type : str
     task_id : str
-    task_config : typing.Any = None
-    dataloader : typing.Any = None # dataloder
+    task_config : typing.Optional["GSConfig"] = None
+    dataloader : typing.Optional[typing.Union["GSgnnNodeDataLoaderBase",
+                                              "GSgnnEdgeDataLoaderBase",
+                                              "GSgnnLinkPredictionDataLoaderBase"]] = None
@@ -21,14 +21,18 @@ from functools import partial
 import operator
 import numpy as np
 import torch as th
+import torch.nn.functional as F
 from sklearn.metrics import roc_auc_score
-from sklearn.metrics import precision_recall_curve, auc, classification_report
+from sklearn.metrics import precision_recall_curve, auc
 
 SUPPORTED_CLASSIFICATION_METRICS = {'accuracy', 'precision_recall', \
     'roc_auc', 'f1_score', 'per_class_f1_score', 'per_class_roc_auc'}
 SUPPORTED_REGRESSION_METRICS = {'rmse', 'mse', 'mae'}
 SUPPORTED_LINK_PREDICTION_METRICS = {"mrr"}
 
+# The initial best value of the metrics for which lower is better.
+_FP32_MAX = float(np.finfo(np.float32).max)
+
 class ClassificationMetrics:
     """ object that compute metrics for classification tasks.
     """
@@ -128,7 +132,7 @@ class RegressionMetrics:
         """
         # Need to check if the given metric is supported first
         self.assert_supported_metric(metric)
-        return np.finfo(np.float32).max
+        return _FP32_MAX
 
 
 class LinkPredictionMetrics:
@@ -190,11 +194,156 @@ def labels_to_one_hot(labels, total_labels):
 
     if len(labels.shape)>1:
         return labels
-    one_hot=np.zeros(shape=(len(labels),total_labels))
-    for i, label in enumerate(labels):
-        one_hot[i,label]=1
+    if labels.dtype != np.intp:
+        labels = labels.astype(np.intp)
+    one_hot=np.zeros(shape=(len(labels),total_labels), dtype=np.float32)
+    # Raise an IndexError if any label is not smaller than total_labels.
+    one_hot[np.arange(len(labels)), labels]=1
     return one_hot
 
+def _to_numpy(tensor):
+    """ Copy a tensor to a numpy array on CPU.
+    """
+    return tensor.detach().cpu().numpy()
+
+def copy_to_host(y_preds, y_targets):
+    """ Copy the predictions and labels to numpy arrays on CPU.
+
+        The copies can be passed to the metrics of the same predictions through
+        ``host_copy``, so that the tensors are only copied from the device once.
+
+        Returns
+        -------
+        tuple of np.ndarray: The predictions and labels.
+    """
+    return _to_numpy(y_preds), _to_numpy(y_targets)
+
+def _prepare_binary_targets(y_preds, y_targets):
+    """ Take the scores of class 1 for binary predictions.
+
+        Binary predictions are in shape (n_samples, 2) with labels in shape (n_samples,)
+        or (n_samples, 1). Other inputs are returned as they are.
+
+        Returns
+        -------
+        tuple: The predictions and labels, in shape (n_samples,) for binary cases.
+    """
+    if len(y_preds.shape) > 1 and y_preds.shape[1] == 2:
+        if len(y_targets.shape) == 1:
+            return y_preds[:, 1], y_targets
+        if len(y_targets.shape) == 2 and y_targets.shape[1] == 1:
+            return y_preds[:, 1], y_targets.squeeze(1)
+    return y_preds, y_targets
+
+def _binary_clf_curve(scores, labels, weights=None):
+    """ Compute the cumulative true/false positive counts over the sorted scores.
+
+        Scores are processed along the last dimension, so a 2D input of shape
+        (n_classes, n_samples) computes the curves of all the classes in a single pass.
+
+        Parameters
+        ----------
+        scores: th.Tensor
+            Predicted scores in shape (n_samples,) or (n_classes, n_samples).
+        labels: th.Tensor
+            Binary labels of 0s and 1s with the same shape as scores.
+        weights: th.Tensor
+            Sample weights broadcastable to the shape of scores. Samples
+            with zero weights are ignored.
+
+        Returns
+        -------
+        tuple of th.Tensor: The weighted true and false positive counts in float64 over the
+        scores sorted in descending order, the mask of the last sample of each group of tied
+        scores, i.e., the thresholds of the curve, and whether any label is not 0 or 1.
+    """
+    if scores.shape != labels.shape:
+        raise ValueError("Found input variables with inconsistent numbers of samples: " \
+                         f"{list(scores.shape)} and {list(labels.shape)}.")
+    scores = scores.detach()
+    # The labels can be on a different device, e.g., CPU labels with GPU predictions.
+    labels = labels.detach().to(scores.device)
+    if weights is None:
+        weights = th.ones(scores.shape, dtype=th.float64, device=scores.device)
+    else:
+        weights = th.as_tensor(weights, device=scores.device).to(th.float64).expand(scores.shape)
+    is_pos = (labels == 1).to(th.float64)
+
+    sorted_scores, order = th.sort(scores, dim=-1, descending=True)
+    tps = th.cumsum(th.gather(is_pos * weights, -1, order), dim=-1)
+    fps = th.cumsum(th.gather((1. - is_pos) * weights, -1, order), dim=-1)
+    is_threshold = th.ones_like(sorted_scores, dtype=th.bool)
+    is_threshold[..., :-1] = sorted_scores[..., 1:] != sorted_scores[..., :-1]
+    is_non_binary = th.any((labels != 0) & (labels != 1) & (weights != 0))
+    return tps, fps, is_threshold, is_non_binary
+
+def _auroc_from_curve(tps, fps, is_threshold, is_non_binary):
+    """ Compute ROC-AUC scores from the output of ``_binary_clf_curve``.
+    """
+    num_pos, num_neg = tps[..., -1], fps[..., -1]
+    # Only labels of 0s and 1s are supported and both classes need to present,
+    # checked together to only synchronize with the device once.
+    is_invalid = th.any((num_pos == 0) | (num_neg == 0)) | is_non_binary
+    if is_invalid.item():
+        raise ValueError("ROC AUC score requires binary labels of 0s and 1s with both " \
+                         "classes present.")
+
+    zeros = th.zeros_like(tps)
+    # tps and fps are non-decreasing, so the running max over thresholds gives
+    # the counts at the previous threshold.
+    prev_tps = th.cummax(th.where(is_threshold, tps, zeros), dim=-1).values
+    prev_fps = th.cummax(th.where(is_threshold, fps, zeros), dim=-1).values
+    prev_tps = th.cat([zeros[..., :1], prev_tps[..., :-1]], dim=-1)
+    prev_fps = th.cat([zeros[..., :1], prev_fps[..., :-1]], dim=-1)
+    area = th.sum(th.where(is_threshold, (fps - prev_fps) * (tps + prev_tps), zeros), dim=-1)
+    return area / (2 * num_pos * num_neg)
+
+def _pr_auc_from_curve(tps, fps, is_threshold, is_non_binary):
+    """ Compute the area under the precision-recall curve from the 1D output of
+        ``_binary_clf_curve``, which gives the same result as sklearn's
+        ``auc(recall, precision)`` over ``precision_recall_curve``.
+    """
+    if is_non_binary.item():
+        raise ValueError("Precision-recall curve requires binary labels of 0s and 1s.")
+    num_preds = tps + fps
+    # Thresholds only made of samples with zero weights are not on the curve.
+    is_threshold = is_threshold & (num_preds != 0)
+    tps, fps, num_preds = tps[is_threshold], fps[is_threshold], num_preds[is_threshold]
+    precision = tps / num_preds
+    # Recall is 1 at all thresholds if there is no positive label.
+    recall = th.where(tps[-1] != 0, tps / tps[-1], th.ones_like(tps))
+
+    # Same as sklearn, recall is in decreasing order and ends with the point of
+    # recall 0 and precision 1.
+    precision = th.cat([th.flip(precision, (0,)), th.ones_like(precision[:1])])
+    recall = th.cat([th.flip(recall, (0,)), th.zeros_like(recall[:1])])
+    return -th.sum((recall[1:] - recall[:-1]) * (precision[1:] + precision[:-1]) / 2.0)
+
+def _torch_auroc(scores, labels, weights=None):
+    """ Compute ROC-AUC scores with torch operations on the device of the inputs.
+
+        The area is computed from the cumulative true/false positive counts at
+        every distinct score threshold, integrated with the trapezoidal rule,
+        which gives the same result as sklearn's roc_auc_score for binary labels.
+        Scores are processed along the last dimension, so a 2D input of shape
+        (n_classes, n_samples) computes one score per class in a single pass.
+
+        Parameters
+        ----------
+        scores: th.Tensor
+            Predicted scores in shape (n_samples,) or (n_classes, n_samples).
+        labels: th.Tensor
+            Binary labels of 0s and 1s with the same shape as scores.
+        weights: th.Tensor
+            Sample weights broadcastable to the shape of scores. Samples
+            with zero weights are ignored.
+
+        Returns
+        -------
+        th.Tensor: The ROC-AUC score(s) in float64, a 0-D tensor for a 1D input.
+    """
+    return _auroc_from_curve(*_binary_clf_curve(scores, labels, weights))
+
 def eval_roc_auc(logits,labels):
     ''' Compute roc_auc score.
         If any errors occur, raise the error to callers and stop.
@@ -212,9 +361,8 @@ def eval_roc_auc(logits,labels):
         -------
         float: The roc_auc score.
     '''
-    predicted_labels=logits
-    predicted_labels=predicted_labels.detach().cpu().numpy()
-    labels=labels.detach().cpu().numpy()
+    predicted_labels=logits.detach()
+    labels=labels.detach()
 
     # check if the two inputs have the same number of rows.
     assert predicted_labels.shape[0] == labels.shape[0], 'ERROR: Predictions and labes ' + \
@@ -225,44 +373,41 @@ def eval_roc_auc(logits,labels):
     assert len(predicted_labels.shape) == 2, 'ERROR: GraphStorm assumes the predicted ' + \
                                              'logit is a 2D tesnor, but got a 1D tensor.'
 
-    # The roc_auc_score function computes the area under the receiver operating characteristic
+    # The roc_auc score is the area under the receiver operating characteristic
     # (ROC) curve, which is also denoted by AUC or AUROC. The following returns the average AUC.
-    rocauc_list = []
 
-    # Binary results, the sklearn roc_auc_score function asks 1D inputs of predictions.
-    # And the label is a 1D tensor. For other cases, the sklearn roc_auc_score function asks
-    # nD inputs of predictions. So here we need to check the predictions' 2nd dim for the binary
-    # conditions.
+    # Binary results, the label is a 1D tensor, or a 2D tensor with one column, and the
+    # 2nd dim of the predictions is the probability of 1s. So here we need to check the
+    # predictions' 2nd dim for the binary conditions.
     if predicted_labels.shape[1] == 2:
         if len(labels.shape) == 1:
             # Here use the 2nd dim, assuming it is the probability of 1s.
-            rocauc_list.append(roc_auc_score(labels, predicted_labels[:, 1]))
-            return sum(rocauc_list) / len(rocauc_list)
+            return _torch_auroc(predicted_labels[:, 1], labels).item()
         elif len(labels.shape) == 2 and labels.shape[1] == 1:
             # Here use the 2nd dim, assuming it is the probability of 1s.
-            rocauc_list.append(roc_auc_score(labels.squeeze(), predicted_labels[:, 1]))
-            return sum(rocauc_list) / len(rocauc_list)
+            return _torch_auroc(predicted_labels[:, 1], labels.squeeze(1)).item()
 
     # mutiple class and multiple labels cases
     try:
-        labels=labels_to_one_hot(labels, predicted_labels.shape[1])
+        labels=labels_to_one_hot(_to_numpy(labels), predicted_labels.shape[1])
     except IndexError as e:
         logging.error("Failure found during evaluation of the roc_auc score metric due to" + \
                       " reason: %s", str(e))
         raise
+    labels = th.as_tensor(labels, device=predicted_labels.device)
 
-    for i in range(labels.shape[1]):
-        # AUC is only defined when there is at least one positive data.
-        if np.sum(labels[:, i] == 1) > 0 and np.sum(labels[:, i] == 0) > 0:
-            is_labeled = labels[:, i] == labels[:, i]
-            rocauc_list.append(roc_auc_score(labels[is_labeled, i],
-                                            predicted_labels[is_labeled, i]))
-
-    if len(rocauc_list) == 0:
+    # AUC is only defined when there is at least one positive data.
+    is_valid = th.any(labels == 1, dim=0) & th.any(labels == 0, dim=0)
+    if not th.any(is_valid).item():
         logging.error('No positively labeled data available. Cannot compute ROC-AUC.')
         return 0
 
-    return sum(rocauc_list) / len(rocauc_list)
+    # Compute the scores of all the valid classes together, in shape (n_classes, n_samples).
+    # Samples without labels, i.e., NaN, are ignored through zero weights.
+    labels = labels[:, is_valid].T
+    rocauc = _torch_auroc(predicted_labels[:, is_valid].T, labels,
+                          weights=(labels == labels).to(th.float64))
+    return th.mean(rocauc).item()
 
 def eval_acc(pred, labels):
     """compute evaluation accuracy.
@@ -288,9 +433,110 @@ def eval_acc(pred, labels):
                                                                     "predictions are " + \
                                                                     "expected to be integer type."
 
-    return th.sum(pred.cpu() == labels.cpu()).item() / len(labels)
+    # Compare on the device of the predictions, only the count is copied back.
+    return th.sum(pred == labels.to(pred.device)).item() / len(labels)
+
+def _classification_counts(y_true, y_pred):
+    """ Count the true positives, false positives and false negatives of each class.
+
+        Parameters
+        ----------
+        y_true: np.ndarray
+            Labels in shape (n_samples,), or binary label indicators in shape
+            (n_samples, n_classes) for multi-label classification.
+        y_pred: np.ndarray
+            Predicted labels in the same format as y_true.
 
-def compute_f1_score(y_preds, y_targets):
+        Returns
+        -------
+        tuple of np.ndarray: The class labels and the counts of true positives, false
+        positives and false negatives of each class.
+    """
+    if y_true.ndim == 2 and y_true.shape[1] == 1:
+        y_true = y_true.reshape(-1)
+    if y_pred.ndim == 2 and y_pred.shape[1] == 1:
+        y_pred = y_pred.reshape(-1)
+    if y_true.shape != y_pred.shape or y_true.ndim not in (1, 2):
+        raise ValueError("Classification metrics expect labels and predictions in the same " \
+                         f"shape of 1D or 2D, but got {y_true.shape} and {y_pred.shape}.")
+    if np.issubdtype(y_true.dtype, np.floating) or np.issubdtype(y_pred.dtype, np.floating):
+        if np.any(y_true != np.round(y_true)) or np.any(y_pred != np.round(y_pred)):
+            raise ValueError("Classification metrics can not handle continuous labels " \
+                             "or predictions.")
+        y_true, y_pred = y_true.astype(np.int64), y_pred.astype(np.int64)
+
+    if y_true.ndim == 1:
+        # Multi-class cases: count from the confusion matrix of the labels present.
+        labels, inverse = np.unique(np.concatenate([y_true, y_pred]), return_inverse=True)
+        num_labels = len(labels)
+        conf_matrix = np.bincount(inverse[:len(y_true)] * num_labels + inverse[len(y_true):],
+                                  minlength=num_labels * num_labels)
+        conf_matrix = conf_matrix.reshape(num_labels, num_labels)
+        tps = np.diag(conf_matrix)
+        return labels, tps, conf_matrix.sum(axis=0) - tps, conf_matrix.sum(axis=1) - tps
+
+    # Multi-label cases: each column is a binary label indicator.
+    if np.any((y_true != 0) & (y_true != 1)) or np.any((y_pred != 0) & (y_pred != 1)):
+        raise ValueError("Multi-label classification metrics expect binary label indicators.")
+    y_true, y_pred = y_true.astype(bool), y_pred.astype(bool)
+    labels = np.arange(y_true.shape[1])
+    if hasattr(np, "bitwise_count"):
+        # Pack 8 samples per byte and count the bits, available since NumPy 2.0.
+        y_true, y_pred = np.packbits(y_true, axis=0), np.packbits(y_pred, axis=0)
+        def _count(x):
+            return np.bitwise_count(x).sum(axis=0, dtype=np.int64)
+    else:
+        try:
+            # numba is optional and only imported when it is used.
+            from .numba_kernels import multilabel_counts # pylint: disable=import-outside-toplevel
+        except ImportError:
+            multilabel_counts = None
+        if multilabel_counts is not None:
+            # The kernel counts the labels in parallel, each from a contiguous row.
+            return (labels,) + multilabel_counts(np.ascontiguousarray(y_true.T),
+                                                 np.ascontiguousarray(y_pred.T))
+        def _count(x):
+            return x.sum(axis=0, dtype=np.int64)
+    # False positives and negatives follow from the numbers of predictions and labels.
+    tps = _count(y_true & y_pred)
+    return labels, tps, _count(y_pred) - tps, _count(y_true) - tps
+
+def _precision_recall_fscore(tps, fps, fns):
+    """ Compute precision, recall and f1 scores from the counts, 0 when undefined.
+    """
+    tps, fps, fns = [np.asarray(x, dtype=np.float64) for x in (tps, fps, fns)]
+    def _safe_div(num, denom):
+        return np.divide(num, denom, out=np.zeros_like(num), where=denom != 0)
+    return _safe_div(tps, tps + fps), _safe_div(tps, tps + fns), \
+        _safe_div(2 * tps, 2 * tps + fps + fns)
+
+def _f1_report(y_true, y_pred):
+    """ Build the report of compute_per_class_f1_score in the format of
+        sklearn's classification_report(output_dict=True).
+    """
+    labels, tps, fps, fns = _classification_counts(y_true, y_pred)
+    precision, recall, f1_score = _precision_recall_fscore(tps, fps, fns)
+    support = tps + fns
+    total_support = int(support.sum())
+    def _entry(prec, rec, f1, num):
+        return {"precision": float(prec), "recall": float(rec),
+                "f1-score": float(f1), "support": int(num)}
+
+    report = {str(label): _entry(precision[i], recall[i], f1_score[i], support[i]) \
+              for i, label in enumerate(labels)}
+    if y_true.ndim == 1 or y_true.shape[1] == 1:
+        report["accuracy"] = float(tps.sum() / total_support) if total_support > 0 else 0.
+    else:
+        report["micro avg"] = _entry(*_precision_recall_fscore(tps.sum(), fps.sum(), fns.sum()),
+                                     total_support)
+    report["macro avg"] = _entry(np.mean(precision), np.mean(recall), np.mean(f1_score),
+                                 total_support)
+    weights = support / total_support if total_support > 0 else np.zeros(len(labels))
+    report["weighted avg"] = _entry(np.dot(weights, precision), np.dot(weights, recall),
+                                    np.dot(weights, f1_score), total_support)
+    return report
+
+def compute_f1_score(y_preds, y_targets, host_copy=None):
     """ compute macro_average f1 score.
         If any errors occur, raise the error to callers and stop.
 
@@ -300,16 +546,18 @@ def compute_f1_score(y_preds, y_targets):
             predictions after argmax.
         y_targets : 1D list of 0s and 1s
             The 1D label list.
+        host_copy : tuple of np.ndarray
+            The copies of y_preds and y_targets on CPU returned by copy_to_host.
+            They are copied if not given.
 
         Returns
         -------
         float: The f1 score.
     """
-    y_true = y_targets.cpu().numpy()
-    y_pred = y_preds.cpu().numpy()
+    y_pred, y_true = copy_to_host(y_preds, y_targets) if host_copy is None else host_copy
     try:
-        report = classification_report(y_pred=y_pred, y_true=y_true, output_dict=True)
-        f1_score = report['macro avg']['f1-score']
+        _, tps, fps, fns = _classification_counts(y_true, y_pred)
+        f1_score = float(np.mean(_precision_recall_fscore(tps, fps, fns)[2]))
     except ValueError as e:
         logging.error("Failure found during evaluation of the f1 score metric due to" + \
                       " reason: %s", str(e))
@@ -317,7 +565,7 @@ def compute_f1_score(y_preds, y_targets):
 
     return f1_score
 
-def compute_per_class_f1_score(y_preds, y_targets):
+def compute_per_class_f1_score(y_preds, y_targets, host_copy=None):
     """ compute f1 score per class
         If any errors occur, raise the error to callers and stop.
 
@@ -327,15 +575,18 @@ def compute_per_class_f1_score(y_preds, y_targets):
             predictions after argmax.
         y_targets : 1D list of 0s and 1s
             The 1D label list.
+        host_copy : tuple of np.ndarray
+            The copies of y_preds and y_targets on CPU returned by copy_to_host.
+            They are copied if not given.
 
         Returns
         -------
-        float: The f1 score.
+        dict: The precision, recall, f1 score and support of each class and their averages,
+        in the same format as sklearn's classification_report.
     """
-    y_true = y_targets.cpu().numpy()
-    y_pred = y_preds.cpu().numpy()
+    y_pred, y_true = copy_to_host(y_preds, y_targets) if host_copy is None else host_copy
     try:
-        report = classification_report(y_pred=y_pred, y_true=y_true, output_dict=True)
+        report = _f1_report(y_true, y_pred)
     except ValueError as e:
         logging.error("Failure found during evaluation of the per class f1 score metric due to" + \
                       "reason: %s", str(e))
@@ -367,16 +618,33 @@ def compute_acc_lp(pos_score, neg_score):
     """
     num_pos=len(pos_score)
     # perturb object
-    scores = th.cat([pos_score, neg_score], dim=0)
-    scores = th.sigmoid(scores)
-    _, rankings = th.sort(scores, dim=0, descending=True)
-    rankings = rankings.cpu().detach().numpy()
-    rankings = rankings <= num_pos
-    lp_score = sum(rankings[:num_pos]) / num_pos
+    scores = th.cat([pos_score, neg_score], dim=0).detach()
+    # Sigmoid does not change the ranking and only the top num_pos scores are needed,
+    # so there is no need to sort all the scores.
+    _, top_idx = th.topk(scores, num_pos, dim=0, largest=True, sorted=False)
+    lp_score = th.sum(top_idx < num_pos).item() / num_pos
 
     return {"lp_fast_score": lp_score}
 
-def compute_roc_auc(y_preds, y_targets, weights=None):
+def compute_binary_clf_curve(y_preds, y_targets, weights=None):
+    """ Compute the binary classification curve shared by compute_roc_auc and
+        compute_precision_recall_auc, so that the scores are only sorted once.
+
+        Parameters
+        ----------
+        y_preds : Target scores in 2D tensor.
+        y_targets: Array-like of shape (n_samples,) or (n_samples, n_classes) True labels.
+        weights: List of weights with the same number of classes in labels.
+        Returns
+        -------
+        tuple or None: The curve of binary cases, or None for the other cases.
+    """
+    y_pred, y_true = _prepare_binary_targets(y_preds, y_targets)
+    if len(y_pred.shape) == 1 and len(y_true.shape) == 1:
+        return _binary_clf_curve(y_pred, y_true, weights)
+    return None
+
+def compute_roc_auc(y_preds, y_targets, weights=None, curve=None, host_copy=None):
     """ compute ROC's auc score with weights
         If any errors occur, raise the error to callers and stop.
 
@@ -389,28 +657,31 @@ def compute_roc_auc(y_preds, y_targets, weights=None):
                    shape (n_samples,) while the multilabel case expects binary label indicators
                    with shape (n_samples, n_classes).
         weights: List of weights with the same number of classes in labels.
+        curve: The binary classification curve of the predictions returned by
+               compute_binary_clf_curve. It is computed if not given.
+        host_copy: The copies of y_preds and y_targets on CPU returned by copy_to_host,
+                   used by the non-binary cases. They are copied if not given.
         Returns
         -------
         float: The roc_auc score.
     """
-    y_true = y_targets.cpu().numpy()
-    y_pred = y_preds.cpu().numpy()
-
     # check for binary cases, input (n, 2) and label 1D or (n, 1)
-    if len(y_pred.shape) > 1 and y_pred.shape[1] == 2:
-        if len(y_true.shape) == 1:
-            y_pred = y_pred[:, 1]
-        elif len(y_true.shape) == 2 and y_true.shape[1] == 1:
-            y_pred = y_pred[:, 1]
-            y_true = y_true.squeeze()
-
-    if weights is not None:
-        weights = weights.cpu().numpy()
+    y_pred, y_true = _prepare_binary_targets(y_preds, y_targets)
 
     # adding checks since in certain cases the auc might not be defined we do not want to fail
     # the code
     try:
-        auc_score = roc_auc_score(y_true, y_pred, sample_weight=weights, multi_class='ovr')
+        if len(y_pred.shape) == 1 and len(y_true.shape) == 1:
+            # Binary cases are computed on device without copying to CPU.
+            if curve is None:
+                curve = _binary_clf_curve(y_pred, y_true, weights)
+            auc_score = _auroc_from_curve(*curve).item()
+        else:
+            # Multi-class and multi-label cases need the input checks of sklearn.
+            if weights is not None:
+                weights = _to_numpy(weights)
+            y_pred, y_true = copy_to_host(y_pred, y_true) if host_copy is None else host_copy
+            auc_score = roc_auc_score(y_true, y_pred, sample_weight=weights, multi_class='ovr')
     except ValueError as e:
         logging.error("Failure found during evaluation of the roc_auc metric due to the" + \
                       " reason: %s", str(e))
@@ -453,20 +724,16 @@ def compute_per_class_roc_auc(y_preds, y_targets):
                                                    'and labels should be the same, but got ' + \
                                                    f'{y_preds.shape} and {y_targets.shape}.'
 
-    y_true = y_targets.cpu().numpy()
-    y_pred = y_preds.cpu().numpy()
-    roc_auc_report = {}
-
-    avg_roc_auc = compute_roc_auc(y_preds, y_targets)
-    for class_id in range(y_true.shape[1]):
-        try:
-            roc_auc_report[class_id] = roc_auc_score(y_true[:,class_id],
-                                                    y_pred[:,class_id])
-        except ValueError as e:
-            logging.error("Failure found during evaluation of the roc_auc_score metric due to " + \
-                          "the reason: %s", str(e))
-            raise
-    roc_auc_report["overall avg"] = avg_roc_auc
+    try:
+        # Compute the scores of all the classes together, in shape (n_classes, n_samples).
+        per_class_roc_auc = _torch_auroc(y_preds.T, y_targets.T)
+    except ValueError as e:
+        logging.error("Failure found during evaluation of the roc_auc_score metric due to " + \
+                      "the reason: %s", str(e))
+        raise
+    roc_auc_report = dict(enumerate(per_class_roc_auc.tolist()))
+    # Same as the macro average of compute_roc_auc.
+    roc_auc_report["overall avg"] = th.mean(per_class_roc_auc).item()
 
     return roc_auc_report
 
@@ -479,7 +746,7 @@ class PRKeys(str, Enum):
     THRESHOLD = "threshold"
 
 
-def compute_precision_recall_auc(y_preds, y_targets, weights=None):
+def compute_precision_recall_auc(y_preds, y_targets, weights=None, curve=None, host_copy=None):
     """ compute precision, recall, and auc values.
          If any errors occur, raise the error to callers and stop.
 
@@ -491,29 +758,29 @@ def compute_precision_recall_auc(y_preds, y_targets, weights=None):
                    shape (n_samples,) while the multilabel case expects binary label indicators
                    with shape (n_samples, n_classes).
         weights: List of weights with the same number of classes in labels.
+        curve: The binary classification curve of the predictions returned by
+               compute_binary_clf_curve. It is computed if not given.
+        host_copy: The copies of y_preds and y_targets on CPU returned by copy_to_host,
+                   used by the non-binary cases. They are copied if not given.
         Returns
         -------
         float: The precision_recall_auc score.   
     """
-    y_true = y_targets.cpu().numpy()
-    y_pred = y_preds.cpu().numpy()
-
     # same check for binary cases, input in (n, 2) and label in 1D or (n, 1)
-    if len(y_pred.shape) > 1 and y_pred.shape[1] == 2:
-        if len(y_true.shape) == 1:
-            y_pred = y_pred[:, 1]
-        elif len(y_true.shape) == 2 and y_true.shape[1] == 1:
-            y_pred = y_pred[:, 1]
-            y_true = y_true.squeeze()
-
-    keys = [key.value for key in PRKeys]
+    y_pred, y_true = _prepare_binary_targets(y_preds, y_targets)
 
     # adding checks since in certain cases the auc might not be defined we do not want to fail
     # the code
     try:
-        pr_curve = dict(zip(keys, precision_recall_curve(y_true, y_pred, sample_weight=weights)))
-        precision, recall = pr_curve[PRKeys.PRECISION], pr_curve[PRKeys.RECALL]
-        auc_score = auc(recall, precision)
+        if len(y_pred.shape) == 1 and len(y_true.shape) == 1:
+            if curve is None:
+                curve = _binary_clf_curve(y_pred, y_true, weights)
+            auc_score = _pr_auc_from_curve(*curve).item()
+        else:
+            y_pred, y_true = copy_to_host(y_pred, y_true) if host_copy is None else host_copy
+            # The outputs are in the order of PRKeys.
+            precision, recall, _ = precision_recall_curve(y_true, y_pred, sample_weight=weights)
+            auc_score = auc(recall, precision)
     except ValueError as e:
         logging.error("Failure found during evaluation of the precision_recall_auc metric due " + \
                       "to reason: %s", str(e))
@@ -554,13 +821,15 @@ def compute_rmse(pred, labels):
     assert pred.shape == labels.shape, \
         f"prediction and labels have different shapes. {pred.shape} vs. {labels.shape}"
     if pred.dtype != labels.dtype:
-        logging.warning("prediction and labels have different data types: %s vs. %s.",
-                        str(pred.dtype), str(labels.dtype))
-        logging.warning("casting pred to the same dtype as labels.")
-        pred = pred.type(labels.dtype) # cast pred to the same dtype as labels.
+        logging.debug("prediction and labels have different data types: %s vs. %s.",
+                      pred.dtype, labels.dtype)
+        # cast to the wider dtype to not lose precision, e.g., of float16 predictions.
+        dtype = th.promote_types(pred.dtype, labels.dtype)
+        pred, labels = pred.to(dtype), labels.to(dtype)
 
-    diff = pred.cpu() - labels.cpu()
-    return th.sqrt(th.mean(diff * diff)).cpu().item()
+    # Reduce on the device of the predictions, only the result is copied back.
+    # mse_loss squares and sums in one pass without materializing the squares.
+    return th.sqrt(F.mse_loss(pred, labels.to(pred.device))).item()
 
 def compute_mse(pred, labels):
     """ compute MSE for regression
@@ -572,13 +841,14 @@ def compute_mse(pred, labels):
     assert pred.shape == labels.shape, \
         f"prediction and labels have different shapes. {pred.shape} vs. {labels.shape}"
     if pred.dtype != labels.dtype:
-        logging.warning("prediction and labels have different data types: %s vs. %s.",
-                        str(pred.dtype), str(labels.dtype))
-        logging.warning("casting pred to the same dtype as labels.")
-        pred = pred.type(labels.dtype) # cast pred to the same dtype as labels.
+        logging.debug("prediction and labels have different data types: %s vs. %s.",
+                      pred.dtype, labels.dtype)
+        # cast to the wider dtype to not lose precision, e.g., of float16 predictions.
+        dtype = th.promote_types(pred.dtype, labels.dtype)
+        pred, labels = pred.to(dtype), labels.to(dtype)
 
-    diff = pred.cpu() - labels.cpu()
-    return th.mean(diff * diff).cpu().item()
+    # Reduce on the device of the predictions, only the result is copied back.
+    return F.mse_loss(pred, labels.to(pred.device)).item()
 
 def compute_mae(pred, labels):
     """ compute MAE for regression
@@ -590,13 +860,14 @@ def compute_mae(pred, labels):
     assert pred.shape == labels.shape, \
         f"prediction and labels have different shapes. {pred.shape} vs. {labels.shape}"
     if pred.dtype != labels.dtype:
-        logging.warning("prediction and labels have different data types: %s vs. %s.",
-                        pred.dtype, labels.dtype)
-        logging.warning("casting pred to the same dtype as labels.")
-        pred = pred.type(labels.dtype) # cast pred to the same dtype as labels.
+        logging.debug("prediction and labels have different data types: %s vs. %s.",
+                      pred.dtype, labels.dtype)
+        # cast to the wider dtype to not lose precision, e.g., of float16 predictions.
+        dtype = th.promote_types(pred.dtype, labels.dtype)
+        pred, labels = pred.to(dtype), labels.to(dtype)
 
-    diff = th.abs(pred.cpu() - labels.cpu())
-    return th.mean(diff).cpu().item()
+    # Reduce on the device of the predictions, only the result is copied back.
+    return F.l1_loss(pred, labels.to(pred.device)).item()
 
 def compute_mrr(ranking):
     """ Get link prediction mrr metrics
@@ -610,6 +881,5 @@ def compute_mrr(ranking):
         -------
         link prediction mrr metrics: tensor
     """
-    logs = th.div(1.0, ranking)
-    metrics = th.tensor(th.div(th.sum(logs),len(logs)))
-    return metrics
+    # Ranks are integers, float32 is precise enough for their reciprocals.
+    return th.div(1.0, ranking.to(th.float32)).mean()
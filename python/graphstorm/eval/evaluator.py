@@ -21,6 +21,9 @@ from statistics import mean
 import torch as th
 
 from .eval_func import ClassificationMetrics, RegressionMetrics, LinkPredictionMetrics
+from .eval_func import compute_roc_auc, compute_precision_recall_auc
+from .eval_func import compute_f1_score, compute_per_class_f1_score
+from .eval_func import compute_binary_clf_curve, copy_to_host
 from .utils import broadcast_data
 from ..config.config import (EARLY_STOP_AVERAGE_INCREASE_STRATEGY,
                              EARLY_STOP_CONSECUTIVE_INCREASE_STRATEGY,
@@ -553,17 +556,40 @@ class GSgnnClassificationEvaluator(GSgnnBaseEvaluator, GSgnnPredictionEvalInterf
             Evaluation metric values: dict
         """
         results = {}
+        # Intermediate results shared by the metrics of the predictions, computed on first use.
+        shared = {}
         for metric in self.metric_list:
             if pred is not None and labels is not None:
                 if train:
                     # training expects always a single number to be
                     # returned and has a different (potentially) evalution function
-                    results[metric] = self.metrics_obj.metric_function[metric](pred, labels)
+                    metric_func = self.metrics_obj.metric_function[metric]
                 else:
                     # validation or testing may have a different
                     # evaluation function, in our case the evaluation code
                     # may return a dictionary with the metric values for each metric
-                    results[metric] = self.metrics_obj.metric_eval_function[metric](pred, labels)
+                    metric_func = self.metrics_obj.metric_eval_function[metric]
+                kwargs = {}
+                needs_host_copy = metric_func in (compute_f1_score, compute_per_class_f1_score)
+                if metric_func in (compute_roc_auc, compute_precision_recall_auc):
+                    # roc_auc and precision_recall share the binary classification
+                    # curve of the predictions, so the scores are only sorted once.
+                    if "curve" not in shared:
+                        try:
+                            shared["curve"] = compute_binary_clf_curve(pred, labels)
+                        except ValueError:
+                            # Invalid inputs are logged and raised by the metric itself.
+                            shared["curve"] = None
+                    kwargs["curve"] = shared["curve"]
+                    # Non-binary cases are computed by sklearn on CPU.
+                    needs_host_copy = shared["curve"] is None
+                if needs_host_copy:
+                    # The metrics computed on CPU share one copy of the predictions
+                    # and labels, so the tensors are only copied from the device once.
+                    if "host_copy" not in shared:
+                        shared["host_copy"] = copy_to_host(pred, labels)
+                    kwargs["host_copy"] = shared["host_copy"]
+                results[metric] = metric_func(pred, labels, **kwargs)
             else:
                 # if the pred is None or the labels is None the metric can not me computed
                 results[metric] = "N/A"
@@ -0,0 +1,45 @@
+"""
+    Copyright 2023 Contributors
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    Numba kernels of the evaluation functions. numba is only imported
+    together with this module, when the kernels are used.
+"""
+import numba
+import numpy as np
+
+@numba.njit(parallel=True, cache=True)
+def multilabel_counts(y_true, y_pred):
+    """ Count the true positives, false positives and false negatives of each
+        label of boolean label indicators in a single pass, labels in parallel.
+
+        The indicators are in shape (n_labels, n_samples), so each thread reads
+        the samples of its label from contiguous memory.
+    """
+    num_labels, num_samples = y_true.shape
+    tps = np.zeros(num_labels, dtype=np.int64)
+    fps = np.zeros(num_labels, dtype=np.int64)
+    fns = np.zeros(num_labels, dtype=np.int64)
+    for j in numba.prange(num_labels):
+        tp = fp = fn = 0
+        for i in range(num_samples):
+            if y_true[j, i]:
+                if y_pred[j, i]:
+                    tp += 1
+                else:
+                    fn += 1
+            elif y_pred[j, i]:
+                fp += 1
+        tps[j], fps[j], fns[j] = tp, fp, fn
+    return tps, fps, fns
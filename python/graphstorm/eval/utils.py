@@ -15,11 +15,26 @@
 
     Utility functions for evaluation
 """
+import os
+
 import torch as th
 
 from ..utils import get_backend, is_distributed
 from ..data.utils import alltoallv_cpu, alltoallv_nccl
 
+# TF32 runs the float32 matmuls of the negative scores on tensor cores of Ampere
+# or newer GPUs, with a 10-bit mantissa. It is a global torch setting, so it is
+# only enabled on request with GS_EVAL_ALLOW_TF32=1.
+if os.environ.get("GS_EVAL_ALLOW_TF32", "0") == "1":
+    th.backends.cuda.matmul.allow_tf32 = True
+    th.backends.cudnn.allow_tf32 = True
+
+def _to_device(tensor, device):
+    """ Move a tensor to the device. Copies to GPUs are non-blocking, so copies
+        from pinned memory overlap with each other and with the computation.
+    """
+    return tensor.to(device, non_blocking=th.device(device).type == "cuda")
+
 def calc_distmult_pos_score(h_emb, t_emb, r_emb, device=None):
     """ Calculate DistMulti Score for positive pairs
 
@@ -40,9 +55,9 @@ def calc_distmult_pos_score(h_emb, t_emb, r_emb, device=None):
     """
     # DistMult
     if device is not None:
-        r_emb = r_emb.to(device)
-        h_emb = h_emb.to(device)
-        t_emb = t_emb.to(device)
+        r_emb = _to_device(r_emb, device)
+        h_emb = _to_device(h_emb, device)
+        t_emb = _to_device(t_emb, device)
 
     score = th.sum(h_emb * r_emb * t_emb, dim=-1)
     return score
@@ -78,13 +93,14 @@ def calc_distmult_neg_tail_score(heads, tails, r_emb, num_chunks, chunk_size,
     r = r_emb
 
     if device is not None:
-        r = r.to(device)
-        heads = heads.to(device)
-        tails = tails.to(device)
+        r = _to_device(r, device)
+        heads = _to_device(heads, device)
+        tails = _to_device(tails, device)
     tails = tails.reshape(num_chunks, neg_sample_size, hidden_dim)
-    tails = th.transpose(tails, 1, 2)
-    tmp = (heads * r).reshape(num_chunks, chunk_size, hidden_dim)
-    return th.bmm(tmp, tails)
+    # The relation embedding is one row or one row per edge, broadcast to the heads.
+    heads = (heads * r).reshape(num_chunks, chunk_size, hidden_dim)
+    # Contract with the tails as a batched matmul, without transposing the tails.
+    return th.einsum('ncd,nkd->nck', heads, tails)
 
 def calc_distmult_neg_head_score(heads, tails, r_emb, num_chunks, chunk_size,
     neg_sample_size, device=None):
@@ -116,13 +132,14 @@ def calc_distmult_neg_head_score(heads, tails, r_emb, num_chunks, chunk_size,
     hidden_dim = tails.shape[1]
     r = r_emb
     if device is not None:
-        r = r.to(device)
-        heads = heads.to(device)
-        tails = tails.to(device)
+        r = _to_device(r, device)
+        heads = _to_device(heads, device)
+        tails = _to_device(tails, device)
     heads = heads.reshape(num_chunks, neg_sample_size, hidden_dim)
-    heads = th.transpose(heads, 1, 2)
-    tmp = (tails * r).reshape(num_chunks, chunk_size, hidden_dim)
-    return th.bmm(tmp, heads)
+    # The relation embedding is one row or one row per edge, broadcast to the tails.
+    tails = (tails * r).reshape(num_chunks, chunk_size, hidden_dim)
+    # Contract with the heads as a batched matmul, without transposing the heads.
+    return th.einsum('ncd,nkd->nck', tails, heads)
 
 def calc_dot_pos_score(h_emb, t_emb):
     """ Calculate Dot product Score for positive pairs
@@ -141,7 +158,7 @@ def calc_dot_pos_score(h_emb, t_emb):
         Dot product score: th.Tensor
     """
     # DistMult
-    score = th.sum(h_emb * t_emb, dim=-1)
+    score = th.einsum('...d,...d->...', h_emb, t_emb)
     return score
 
 def calc_dot_neg_tail_score(heads, tails, num_chunks, chunk_size,
@@ -172,12 +189,11 @@ def calc_dot_neg_tail_score(heads, tails, num_chunks, chunk_size,
     hidden_dim = heads.shape[1]
 
     if device is not None:
-        heads = heads.to(device)
-        tails = tails.to(device)
+        heads = _to_device(heads, device)
+        tails = _to_device(tails, device)
     tails = tails.reshape(num_chunks, neg_sample_size, hidden_dim)
-    tails = th.transpose(tails, 1, 2)
-    tmp = heads.reshape(num_chunks, chunk_size, hidden_dim)
-    return th.bmm(tmp, tails)
+    heads = heads.reshape(num_chunks, chunk_size, hidden_dim)
+    return th.einsum('ncd,nkd->nck', heads, tails)
 
 def calc_dot_neg_head_score(heads, tails, num_chunks, chunk_size,
     neg_sample_size, device=None):
@@ -206,12 +222,11 @@ def calc_dot_neg_head_score(heads, tails, num_chunks, chunk_size,
     """
     hidden_dim = tails.shape[1]
     if device is not None:
-        heads = heads.to(device)
-        tails = tails.to(device)
+        heads = _to_device(heads, device)
+        tails = _to_device(tails, device)
     heads = heads.reshape(num_chunks, neg_sample_size, hidden_dim)
-    heads = th.transpose(heads, 1, 2)
-    tmp = tails.reshape(num_chunks, chunk_size, hidden_dim)
-    return th.bmm(tmp, heads)
+    tails = tails.reshape(num_chunks, chunk_size, hidden_dim)
+    return th.einsum('ncd,nkd->nck', tails, heads)
 
 def calc_ranking(pos_score, neg_score):
     """ Calculate ranking of positive scores among negative scores
@@ -228,12 +243,12 @@ def calc_ranking(pos_score, neg_score):
         ranking of positive scores: th.Tensor
     """
     pos_score = pos_score.view(-1, 1)
-    # perturb object
-    scores = th.cat([pos_score, neg_score], dim=1)
-    scores = th.sigmoid(scores)
-    _, indices = th.sort(scores, dim=1, descending=True)
-    indices = th.nonzero(indices == 0)
-    rankings = indices[:, 1].view(-1) + 1
+    # The ranking of a positive score is one plus the number of negative scores
+    # ranked before it, so there is no need to sort the scores. Sigmoid does not
+    # change the order and is skipped. Negative scores tied with the positive score
+    # are ranked before it, so a model that gives all candidates the same score
+    # gets the worst ranking instead of the best one.
+    rankings = th.sum(neg_score >= pos_score, dim=1) + 1
     rankings = rankings.detach()
     if is_distributed() and get_backend() == "gloo":
         rankings = rankings.cpu() # Save GPU memory
@@ -252,19 +267,16 @@ def gen_lp_score(ranking):
         -------
         link prediction eval metrics: list of dict
     """
-    logs = []
-    for rank in ranking:
-        logs.append({
-            'mrr': 1.0 / rank,
-            'mr': float(rank),
-            'hits@1': 1.0 if rank <= 1 else 0.0,
-            'hits@3': 1.0 if rank <= 3 else 0.0,
-            'hits@10': 1.0 if rank <= 10 else 0.0
-        })
-    metrics = {}
-    for metric in logs[0]:
-        metrics[metric] = th.tensor(sum(log[metric] for log in logs) / len(logs))
-    return metrics
+    # Average in float64 as the per-rank Python floats did, then return float32 tensors.
+    ranking = ranking.to(th.float64)
+    metrics = {
+        'mrr': th.mean(1.0 / ranking),
+        'mr': th.mean(ranking),
+        'hits@1': th.mean((ranking <= 1).to(th.float64)),
+        'hits@3': th.mean((ranking <= 3).to(th.float64)),
+        'hits@10': th.mean((ranking <= 10).to(th.float64))
+    }
+    return {metric: score.to(th.float32) for metric, score in metrics.items()}
 
 def gen_mrr_score(ranking):
     """ Get link prediction mrr metrics
@@ -278,12 +290,11 @@ def gen_mrr_score(ranking):
         -------
         link prediction eval metrics: list of dict
     """
-    logs = th.div(1.0, ranking)
-    metrics = {"mrr": th.tensor(th.div(th.sum(logs),len(logs)))}
+    metrics = {"mrr": th.div(1.0, ranking).mean()}
     return metrics
 
 
-def broadcast_data(rank, world_size, data_tensor):
+def broadcast_data(rank, world_size, data_tensor, comm_dtype=None):
     """ Broadcast local data to all trainers in the cluster using all2all
 
         After broadcast_data, each trainer will get all the data (data_tensor)
@@ -296,32 +307,50 @@ def broadcast_data(rank, world_size, data_tensor):
             The size of the entire
         data_tensor:
             Data to exchange
+        comm_dtype: th.dtype
+            The data type to exchange floating point data in with the nccl backend,
+            e.g., th.bfloat16 halves the communication of float32 data at the cost
+            of precision. The gathered data is cast back to the data type of
+            data_tensor. By default, the data is exchanged as it is.
     """
     if world_size == 1: # world size is 1, nothing to do
         return data_tensor
 
     # exchange the data size of each trainer
+    out_dtype = data_tensor.dtype
     if get_backend() == "gloo":
         device = "cpu"
     elif get_backend() == "nccl":
         data_tensor = data_tensor.cuda()
+        if comm_dtype is not None and th.is_floating_point(data_tensor):
+            data_tensor = data_tensor.to(comm_dtype)
         device = data_tensor.device
     else:
         assert False, f"backend {get_backend()} not supported."
 
-    data_size = th.zeros((world_size,), dtype=th.int64, device=device)
-    data_size[rank] = data_tensor.shape[0]
-    th.distributed.all_reduce(data_size,
-        op=th.distributed.ReduceOp.SUM)
+    # Each trainer only contributes its own size, gathered into the slices of data_size.
+    data_size = th.empty((world_size,), dtype=th.int64, device=device)
+    th.distributed.all_gather(list(data_size.split(1)),
+        th.tensor([data_tensor.shape[0]], dtype=th.int64, device=device))
 
-    gather_list = [th.empty([int(size)]+list(data_tensor.shape[1:]),
+    # Receive the data into the slices of a single buffer, so there is
+    # no need to concatenate them afterwards.
+    sizes = data_size.tolist()
+    gathered_data = th.empty([sum(sizes)]+list(data_tensor.shape[1:]),
         dtype=data_tensor.dtype,
-        device=device) for size in data_size]
-    data_tensors = [data_tensor for _ in data_size]
-    if get_backend() == "gloo":
+        device=device)
+    gather_slices = th.split(gathered_data, sizes)
+    gather_list = list(gather_slices)
+    data_tensors = [data_tensor for _ in sizes]
+    if all(size == sizes[0] for size in sizes):
+        # Every trainer sends the same data to all the others, which is an
+        # all_gather. It needs the same data size on all the trainers.
+        th.distributed.all_gather(gather_list, data_tensor.to(device).contiguous())
+    elif get_backend() == "gloo":
         alltoallv_cpu(rank, world_size, gather_list, data_tensors)
+        # alltoallv_cpu replaces the local slice with the local data instead of receiving it.
+        gather_slices[rank].copy_(gather_list[rank])
     else: #get_backend() == "nccl"
         alltoallv_nccl(gather_list, data_tensors)
 
-    data_tensor = th.cat(gather_list, dim=0)
-    return data_tensor
+    return gathered_data.to(out_dtype)
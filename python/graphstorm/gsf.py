@@ -704,7 +704,10 @@ def set_encoder(model, g, config, train_task):
                                           use_node_embeddings=config.use_node_embeddings,
                                           force_no_embeddings=config.construct_feat_ntype,
                                           num_ffn_layers_in_input=config.num_ffn_layers_in_input,
-                                          use_wholegraph_sparse_emb=config.use_wholegraph_embed)
+                                          use_wholegraph_sparse_emb=config.use_wholegraph_embed,
+                                          sparse_cache_size=config.sparse_emb_cache_size,
+                                          quantize_sparse_cache=config.quantize_sparse_emb_cache,
+                                          compile_proj=config.compile_input_proj)
     # The number of feature dimensions can change. For example, the feature dimensions
     # of BERT embeddings are determined when the input encoder is created.
     feat_size = encoder.in_dims
@@ -880,6 +880,9 @@ class LinkPredictDistMultDecoder(LinkPredictLearnableDecoder):
             rid = self.etype2rid[canonical_etype]
             rel_embedding = self._w_relation(
                 th.tensor(rid).to(self._w_relation.weight.device))
+            if device is not None:
+                # Move the relation embedding once for the positive and negative scores.
+                rel_embedding = rel_embedding.to(device)
             pos_scores = calc_distmult_pos_score(
                 pos_src_emb, pos_dst_emb, rel_embedding, device)
             neg_scores = []
@@ -56,11 +56,121 @@ def init_emb(shape, dtype):
     -------
     Tensor : the tensor with random values.
     """
-    arr = th.zeros(shape, dtype=dtype)
+    # The tensor is filled by uniform_ directly, so it does not need to be zeroed first.
+    arr = th.empty(shape, dtype=dtype)
     nn.init.uniform_(arr, -1.0, 1.0)
     return arr
 
 
+def _activate_and_dropout(emb, activation, dropout):
+    """ Apply the activation and dropout on the projected embeddings.
+
+    It is a standalone function so that ``torch.compile`` can fuse the two
+    element-wise operations into one kernel.
+    """
+    return dropout(activation(emb))
+
+
+class _EmbedCache:
+    """ A direct-mapped cache of sparse embedding rows keyed on node ID.
+
+    Node ``i`` is stored in slot ``i % capacity`` so that hits and misses of a
+    whole mini-batch can be resolved with tensor operations. The cached rows are
+    not updated by the sparse optimizer, so the cache can only serve lookups
+    that do not need gradients, e.g., inference.
+
+    If ``quantize`` is True, the rows are stored in INT8 with a per-row scale,
+    which keeps four times more rows than FP32 in the same memory. Cache hits
+    return the dequantized rows, while misses return the exact fetched rows.
+
+    Parameters
+    ----------
+    capacity : int
+        The number of embedding rows kept in the cache.
+    quantize : bool
+        Whether or not to store the cached rows in INT8.
+    """
+    def __init__(self, capacity, quantize=False):
+        assert capacity > 0, "The capacity of the embedding cache should be positive."
+        self._capacity = capacity
+        self._quantize = quantize
+        self._tags = None
+        self._data = None
+        self._scales = None
+
+    def reset(self):
+        """ Drop all cached rows.
+        """
+        self._tags = None
+        self._data = None
+        self._scales = None
+
+    def _read(self, slots, dtype):
+        """ Read the rows in the given slots.
+        """
+        if not self._quantize:
+            return self._data[slots]
+        return self._data[slots].to(dtype) * self._scales[slots].unsqueeze(1)
+
+    def _write(self, slots, rows):
+        """ Write the rows into the given slots.
+        """
+        if not self._quantize:
+            self._data[slots] = rows
+            return
+        # Symmetric quantization: the largest magnitude of a row maps to 127.
+        scales = th.clamp(rows.abs().amax(dim=1) / 127., min=th.finfo(rows.dtype).tiny)
+        self._data[slots] = th.round(rows / scales.unsqueeze(1)).to(th.int8)
+        self._scales[slots] = scales
+
+    def lookup(self, sparse_emb, idx, device):
+        """ Look up the embeddings of ``idx`` and fetch the missing rows from ``sparse_emb``.
+
+        Parameters
+        ----------
+        sparse_emb : DistEmbedding
+            The sparse embedding that stores all rows.
+        idx : th.Tensor
+            The node IDs to look up. They should be on CPU.
+        device : th.device
+            The device where the embeddings are returned.
+
+        Returns
+        -------
+        th.Tensor : the embeddings of the nodes.
+        """
+        device = th.device(device)
+        if self._data is None or self._data.device != device:
+            # The tags stay on CPU, where the node IDs and the DistEmbedding lookups are.
+            self._tags = th.full((self._capacity,), -1, dtype=th.int64)
+            dtype = th.int8 if self._quantize else sparse_emb.weight.dtype
+            self._data = th.zeros((self._capacity, sparse_emb.embedding_dim),
+                                  dtype=dtype, device=device)
+            if self._quantize:
+                self._scales = th.zeros((self._capacity,),
+                                        dtype=sparse_emb.weight.dtype, device=device)
+        idx = idx.long()
+        slots = th.remainder(idx, self._capacity)
+        miss = self._tags[slots] != idx
+        out = th.empty((len(idx), sparse_emb.embedding_dim),
+                       dtype=sparse_emb.weight.dtype, device=device)
+        # Only read the slots of the cached nodes.
+        hit = ~miss
+        if th.any(hit):
+            out[hit.to(device)] = self._read(slots[hit].to(device), sparse_emb.weight.dtype)
+        if th.any(miss):
+            miss_idx = idx[miss]
+            miss_slots = slots[miss]
+            miss_emb = sparse_emb(miss_idx, device)
+            out[miss.to(device)] = miss_emb
+            # Different nodes in the same batch may map to the same slot. Only keep
+            # the rows of the node whose ID ends up in the slot tag.
+            self._tags[miss_slots] = miss_idx
+            keep = self._tags[miss_slots] == miss_idx
+            self._write(miss_slots[keep].to(device), miss_emb[keep.to(device)])
+        return out
+
+
 class GSNodeInputLayer(GSLayer):  # pylint: disable=abstract-method
     """The input layer for all nodes in a heterogeneous graph.
 
@@ -162,6 +272,13 @@ class GSNodeInputLayer(GSLayer):  # pylint: disable=abstract-method
         """
         return False
 
+    def reset_sparse_emb_caches(self):
+        """ Drop the cached rows of the sparse embeddings, which are stale once
+            the sparse embeddings are updated.
+
+            Note: By default, a GSNodeInputLayer does not cache sparse embeddings.
+        """
+
 
 class GSNodeEncoderInputLayer(GSNodeInputLayer):
     """The input encoder layer for all nodes in a heterogeneous graph.
@@ -197,6 +314,15 @@ class GSNodeEncoderInputLayer(GSNodeInputLayer):
         Whether or not to cache the embeddings.
     use_wholegraph_sparse_emb : bool
         Whether or not to use WholeGraph to host embeddings for sparse updates.
+    sparse_cache_size : int
+        The number of rows of each DistEmbedding cached on the output device
+        when the layer is in eval mode. 0 disables the cache.
+    quantize_sparse_cache : bool
+        Whether or not to store the rows in the sparse embedding cache in INT8
+        with per-row scales. The cached rows lose precision.
+    compile_proj : bool
+        Whether or not to fuse the activation and dropout after the projections
+        with ``torch.compile``. It requires PyTorch 2.0 or later.
 
     Examples:
     ----------
@@ -227,7 +353,10 @@ class GSNodeEncoderInputLayer(GSNodeInputLayer):
                  num_ffn_layers_in_input=0,
                  ffn_activation=F.relu,
                  cache_embed=False,
-                 use_wholegraph_sparse_emb=False):
+                 use_wholegraph_sparse_emb=False,
+                 sparse_cache_size=0,
+                 quantize_sparse_cache=False,
+                 compile_proj=False):
         super(GSNodeEncoderInputLayer, self).__init__(g)
         self.embed_size = embed_size
         self.dropout = nn.Dropout(dropout)
@@ -245,6 +374,9 @@ class GSNodeEncoderInputLayer(GSNodeInputLayer):
                 "WholeGraph sparse embedding is only supported on NCCL backend."
             assert is_wholegraph_init(), \
                 "WholeGraph is not initialized yet."
+        # Look up the graph metadata once.
+        ntypes = list(g.ntypes)
+        num_nodes = {ntype: g.number_of_nodes(ntype) for ntype in ntypes}
         if (
             dgl.__version__ <= "1.1.2"
             and is_distributed()
@@ -256,7 +388,7 @@ class GSNodeEncoderInputLayer(GSNodeInputLayer):
                     "NCCL backend is not supported for utilizing "
                     + "node embeddings. Please use DGL version >=1.1.2 or gloo backend."
                 )
-            for ntype in g.ntypes:
+            for ntype in ntypes:
                 if not feat_size[ntype]:
                     raise NotImplementedError(
                         "NCCL backend is not supported for utilizing "
@@ -268,7 +400,7 @@ class GSNodeEncoderInputLayer(GSNodeInputLayer):
         self.proj_matrix = nn.ParameterDict()
         self.input_projs = nn.ParameterDict()
         embed_name = "embed"
-        for ntype in g.ntypes:
+        for ntype in ntypes:
             feat_dim = 0
             if feat_size[ntype] > 0:
                 feat_dim += feat_size[ntype]
@@ -285,23 +417,11 @@ class GSNodeEncoderInputLayer(GSNodeInputLayer):
                                 "Use WholeGraph to host additional sparse embeddings on node %s",
                                 ntype,
                             )
-                        self._sparse_embeds[ntype] = WholeGraphDistTensor(
-                            (g.number_of_nodes(ntype), self.embed_size),
-                            th.float32,  # to consistent with distDGL's DistEmbedding dtype
-                            embed_name + "_" + ntype,
-                            use_wg_optimizer=True,  # no memory allocation before opt available
-                        )
                     else:
                         if get_rank() == 0:
                             logging.debug("Use additional sparse embeddings on node %s", ntype)
-                        part_policy = g.get_node_partition_policy(ntype)
-                        self._sparse_embeds[ntype] = DistEmbedding(
-                            g.number_of_nodes(ntype),
-                            self.embed_size,
-                            embed_name + "_" + ntype,
-                            init_emb,
-                            part_policy,
-                        )
+                    self._sparse_embeds[ntype] = self._create_sparse_emb(
+                        g, ntype, num_nodes[ntype], embed_name + "_" + ntype)
                     proj_matrix = nn.Parameter(th.Tensor(2 * self.embed_size, self.embed_size))
                     nn.init.xavier_uniform_(proj_matrix, gain=nn.init.calculate_gain("relu"))
                     # nn.ParameterDict support this assignment operation if not None,
@@ -314,24 +434,14 @@ class GSNodeEncoderInputLayer(GSNodeInputLayer):
                         logging.debug(
                             "Use WholeGraph to host sparse embeddings on node %s:%d",
                             ntype,
-                            g.number_of_nodes(ntype),
+                            num_nodes[ntype],
                         )
-                    self._sparse_embeds[ntype] = WholeGraphDistTensor(
-                        (g.number_of_nodes(ntype), self.embed_size),
-                        th.float32,  # to consistent with distDGL's DistEmbedding dtype
-                        embed_name + "_" + ntype,
-                        use_wg_optimizer=True,  # no memory allocation before opt available
-                    )
                 else:
                     if get_rank() == 0:
                         logging.debug('Use sparse embeddings on node %s:%d',
-                                    ntype, g.number_of_nodes(ntype))
-                    part_policy = g.get_node_partition_policy(ntype)
-                    self._sparse_embeds[ntype] = DistEmbedding(g.number_of_nodes(ntype),
-                                    self.embed_size,
-                                    embed_name + '_' + ntype,
-                                    init_emb,
-                                    part_policy=part_policy)
+                                    ntype, num_nodes[ntype])
+                self._sparse_embeds[ntype] = self._create_sparse_emb(
+                    g, ntype, num_nodes[ntype], embed_name + '_' + ntype)
 
                 proj_matrix = nn.Parameter(th.Tensor(self.embed_size, self.embed_size))
                 nn.init.xavier_uniform_(proj_matrix, gain=nn.init.calculate_gain('relu'))
@@ -339,10 +449,169 @@ class GSNodeEncoderInputLayer(GSNodeInputLayer):
 
         # ngnn
         self.num_ffn_layers_in_input = num_ffn_layers_in_input
-        self.ngnn_mlp = nn.ModuleDict({})
-        for ntype in g.ntypes:
-            self.ngnn_mlp[ntype] = NGNNMLP(embed_size, embed_size,
-                            num_ffn_layers_in_input, ffn_activation, dropout)
+        if num_ffn_layers_in_input > 0:
+            self.ngnn_mlp = nn.ModuleDict({})
+            for ntype in ntypes:
+                self.ngnn_mlp[ntype] = NGNNMLP(embed_size, embed_size,
+                                num_ffn_layers_in_input, ffn_activation, dropout)
+        else:
+            # NGNNMLP without layers does not change the embeddings.
+            self.ngnn_mlp = None
+
+        # Cache hot rows of DistEmbedding for inference. WholeGraph embeddings are not
+        # cached because all processes need to join the lookup.
+        self._sparse_emb_caches = {}
+        if sparse_cache_size > 0:
+            for ntype, sparse_emb in self._sparse_embeds.items():
+                if isinstance(sparse_emb, DistEmbedding):
+                    self._sparse_emb_caches[ntype] = _EmbedCache(
+                        sparse_cache_size, quantize=quantize_sparse_cache)
+
+        self._compiled_activate = None
+        # The errors of compiling the function, which is checked in its first call.
+        self._compile_errors = None
+        if compile_proj:
+            if hasattr(th, "compile"):
+                # torch._dynamo is only imported when compilation is requested.
+                from torch._dynamo import exc # pylint: disable=import-outside-toplevel
+                self._compiled_activate = th.compile(_activate_and_dropout, dynamic=True)
+                self._compile_errors = (exc.BackendCompilerFailed, exc.TorchRuntimeError)
+            else:
+                logging.warning("torch.compile is not available in PyTorch %s. "
+                                "The input projections run in eager mode.", th.__version__)
+
+    def _create_sparse_emb(self, g, ntype, num_nodes, name):
+        """ Create the learnable sparse embeddings of a node type.
+
+        The embeddings are hosted by WholeGraph if ``use_wholegraph_sparse_emb``
+        is set, or by DistEmbedding partitioned in the same way as the nodes.
+        """
+        if self._use_wholegraph_sparse_emb:
+            return WholeGraphDistTensor(
+                (num_nodes, self.embed_size),
+                th.float32,  # to consistent with distDGL's DistEmbedding dtype
+                name,
+                use_wg_optimizer=True,  # no memory allocation before opt available
+            )
+        return DistEmbedding(num_nodes,
+                             self.embed_size,
+                             name,
+                             init_emb,
+                             part_policy=g.get_node_partition_policy(ntype))
+
+    def train(self, mode=True):
+        """ Set the layer in training or eval mode.
+
+        The sparse embeddings can be updated once the layer is trained,
+        so the cached embedding rows are dropped.
+        """
+        self.reset_sparse_emb_caches()
+        return super(GSNodeEncoderInputLayer, self).train(mode)
+
+    def reset_sparse_emb_caches(self):
+        """ Drop the cached rows of the sparse embeddings.
+
+        It is called when the layer changes between training and eval mode and
+        after every step of the sparse optimizer.
+        """
+        for cache in self._sparse_emb_caches.values():
+            cache.reset()
+
+    def _activate(self, emb):
+        """ Apply the activation and dropout on the projected embeddings.
+
+        Dropout is skipped in eval mode or when its probability is 0. Otherwise,
+        the compiled version is used if ``compile_proj`` is set. If the
+        compilation fails in the first call, it falls back to eager mode.
+        Other errors are raised to the caller.
+        """
+        if not self.training or self.dropout.p == 0.:
+            return self.activation(emb)
+        if self._compiled_activate is None:
+            return _activate_and_dropout(emb, self.activation, self.dropout)
+        if self._compile_errors is None:
+            return self._compiled_activate(emb, self.activation, self.dropout)
+
+        try:
+            emb = self._compiled_activate(emb, self.activation, self.dropout)
+        except self._compile_errors as err:
+            logging.warning("Fail to compile the input projections: %s. "
+                            "Fall back to eager mode.", err)
+            self._compiled_activate = None
+            return _activate_and_dropout(emb, self.activation, self.dropout)
+        # The function is compiled, no need to check the errors any more.
+        self._compile_errors = None
+        return emb
+
+    def _sparse_emb_lookup(self, ntype, idx, device):
+        """ Look up the sparse embeddings of a node type.
+
+        Nodes sampled by multiple seeds appear multiple times in a mini-batch,
+        so only the unique node IDs are fetched. The embedding cache is only used
+        in eval mode, because the lookups in training mode need to be traced by
+        the sparse optimizer.
+        """
+        sparse_emb = self.sparse_embeds[ntype]
+        is_wholegraph = isinstance(sparse_emb, WholeGraphDistTensor)
+        # If DistEmbedding supports 0-size input, we can remove this if statement.
+        if len(idx) == 0 and not is_wholegraph:
+            return th.zeros((0, sparse_emb.embedding_dim),
+                            device=device, dtype=sparse_emb.weight.dtype)
+
+        uniq_idx, inverse = th.unique(idx, return_inverse=True)
+        if is_wholegraph:
+            uniq_idx = uniq_idx.cuda()
+            # Need all procs pass the following due to nccl all2lallv in wholegraph
+            emb = sparse_emb.module(uniq_idx)
+            # The gathered rows are on the current GPU, which is usually the target device.
+            if emb.device != device:
+                emb = emb.to(device, non_blocking=True)
+        elif not self.training and ntype in self._sparse_emb_caches:
+            emb = self._sparse_emb_caches[ntype].lookup(sparse_emb, uniq_idx, device)
+        else:
+            emb = sparse_emb(uniq_idx, device)
+        return emb.index_select(0, inverse.to(device))
+
+    def _project_feats(self, input_feats):
+        """ Project the input node features to the embedding size.
+
+        Parameters
+        ----------
+        input_feats: dict of Tensor
+            The input node features.
+
+        Returns
+        -------
+        dict of Tensor: the projected node features.
+        """
+        # Under autocast, the matmuls cast floating-point features to the autocast
+        # dtype themselves, so half-precision features (e.g., cached LM embeddings)
+        # are not upcast first. Otherwise, the features are cast to the dtype of
+        # the projection, which also converts the non-float input data.
+        autocast = th.is_autocast_enabled()
+        embs = {}
+        for ntype, feat in input_feats.items():
+            if not (autocast and feat.is_floating_point()):
+                feat = feat.to(self.input_projs[ntype].dtype)
+            embs[ntype] = feat @ self.input_projs[ntype]
+        return embs
+
+    def _fetch_sparse_embs(self, input_nodes, devices):
+        """ Fetch the sparse embeddings of the input nodes.
+
+        Parameters
+        ----------
+        input_nodes: dict of Tensor
+            The input node IDs.
+        devices: dict of th.device
+            The devices to put the embeddings of each node type.
+
+        Returns
+        -------
+        dict of Tensor: the sparse embeddings.
+        """
+        return {ntype: self._sparse_emb_lookup(ntype, input_nodes[ntype], device) \
+            for ntype, device in devices.items()}
 
     def forward(self, input_feats, input_nodes):
         """Forward computation
@@ -360,60 +629,79 @@ class GSNodeEncoderInputLayer(GSNodeInputLayer):
         """
         assert isinstance(input_feats, dict), 'The input features should be in a dict.'
         assert isinstance(input_nodes, dict), 'The input node IDs should be in a dict.'
-        embs = {}
+        # emb_devices: target device to put the gathered sparse embeddings
+        emb_devices = {}
+        wg_emb_devices = {}
+        # empty_embs: the embeddings of the node types without input nodes
+        empty_embs = {}
+        # The device of the projection matrices. All model parameters are assumed
+        # to be on the same device (see GSLayer.device), so it is looked up once.
+        proj_device = None
         for ntype in input_nodes:
             if isinstance(input_nodes[ntype], np.ndarray):
                 # WholeGraphSparseEmbedding requires the input nodes (indexing tensor)
                 # to be a th.Tensor
                 input_nodes[ntype] = th.from_numpy(input_nodes[ntype])
-            emb = None
             if ntype in input_feats:
                 assert ntype in self.input_projs, \
                     f"We need a projection for node type {ntype}"
-                # If the input data is not float, we need to convert it t float first.
-                emb = input_feats[ntype].float() @ self.input_projs[ntype]
                 if self.use_node_embeddings:
                     assert ntype in self.sparse_embeds, \
                         f"We need sparse embedding for node type {ntype}"
-                    # emb.device: target device to put the gathered results
-                    if self._use_wholegraph_sparse_emb:
-                        node_emb = self.sparse_embeds[ntype].module(input_nodes[ntype].cuda())
-                        node_emb = node_emb.to(emb.device, non_blocking=True)
-                    else:
-                        node_emb = self.sparse_embeds[ntype](input_nodes[ntype], emb.device)
-                    concat_emb = th.cat((emb, node_emb), dim=1)
-                    emb = concat_emb @ self.proj_matrix[ntype]
+                device = input_feats[ntype].device
             elif ntype in self.sparse_embeds:  # nodes do not have input features
-                # If the number of the input node of a node type is 0,
-                # return an empty tensor with shape (0, emb_size)
-                device = self.proj_matrix[ntype].device
-                # If DistEmbedding supports 0-size input, we can remove this if statement.
-                if isinstance(self.sparse_embeds[ntype], WholeGraphDistTensor):
-                    # Need all procs pass the following due to nccl all2lallv in wholegraph
-                    emb = self.sparse_embeds[ntype].module(input_nodes[ntype].cuda())
-                    emb = emb.to(device, non_blocking=True)
-                else:
-                    if len(input_nodes[ntype]) == 0:
-                        dtype = self.sparse_embeds[ntype].weight.dtype
-                        embs[ntype] = th.zeros((0, self.sparse_embeds[ntype].embedding_dim),
-                                        device=device, dtype=dtype)
-                        continue
-                    emb = self.sparse_embeds[ntype](input_nodes[ntype], device)
+                if proj_device is None:
+                    proj_device = self.proj_matrix[ntype].device
+                device = proj_device
+            else:
+                continue
 
-                emb = emb @ self.proj_matrix[ntype]
+            # Skip the node types without input nodes. WholeGraph lookups cannot be
+            # skipped because all processes need to join them.
+            if len(input_nodes[ntype]) == 0 \
+                and (ntype not in input_feats or input_feats[ntype].shape[0] == 0) \
+                and not isinstance(self.sparse_embeds.get(ntype, None), WholeGraphDistTensor):
+                empty_embs[ntype] = th.zeros((0, self.embed_size), device=device)
+            elif isinstance(self.sparse_embeds.get(ntype, None), WholeGraphDistTensor):
+                wg_emb_devices[ntype] = device
+            elif ntype in self.sparse_embeds:
+                emb_devices[ntype] = device
+
+        # Issue all WholeGraph gathers back to back before the dense projections,
+        # so that their NCCL collectives are not queued behind the projections and
+        # other processes do not wait for this one to join them.
+        node_embs = self._fetch_sparse_embs(input_nodes, wg_emb_devices)
+        feat_embs = self._project_feats(
+            {ntype: input_feats[ntype] for ntype in input_nodes \
+                if ntype in input_feats and ntype not in empty_embs})
+        # The DistEmbedding rows are fetched by blocking RPCs and copied to the
+        # device on the current stream.
+        node_embs.update(self._fetch_sparse_embs(input_nodes, emb_devices))
+        embs = {}
+        for ntype in input_nodes:
+            if ntype in empty_embs:
+                embs[ntype] = empty_embs[ntype]
+                continue
+            emb = feat_embs.get(ntype, None)
+            if emb is not None:
+                if self.use_node_embeddings:
+                    # Same as th.cat((emb, node_emb), dim=1) @ proj_matrix without
+                    # materializing the concatenated tensor.
+                    proj_matrix = self.proj_matrix[ntype]
+                    emb = th.addmm(emb @ proj_matrix[:self.embed_size],
+                                   node_embs[ntype], proj_matrix[self.embed_size:])
+            elif ntype in node_embs:
+                emb = node_embs[ntype] @ self.proj_matrix[ntype]
 
             if emb is not None:
                 if self.activation is not None:
-                    emb = self.activation(emb)
-                    emb = self.dropout(emb)
+                    emb = self._activate(emb)
                 embs[ntype] = emb
 
-        def _apply(t, h):
-            if self.num_ffn_layers_in_input > 0:
-                h = self.ngnn_mlp[t](h)
-            return h
-
-        embs = {ntype: _apply(ntype, h) for ntype, h in embs.items()}
+        if self.ngnn_mlp is not None:
+            for ntype, emb in embs.items():
+                if emb.shape[0] > 0:
+                    embs[ntype] = self.ngnn_mlp[ntype](emb)
         return embs
 
     def require_cache_embed(self):
@@ -95,6 +95,20 @@ class GSOptimizer():
         assert len(all_opts) > 0, "Optimizer list need to be defined"
         for optimizer in all_opts:
             assert optimizer is not None
+        self._sparse_step_hooks = []
+
+    def register_sparse_step_hook(self, hook):
+        """ Register a function called without arguments after every step of
+        the sparse optimizers, e.g., to drop the cached sparse embeddings.
+        """
+        self._sparse_step_hooks.append(hook)
+
+    def _run_sparse_step_hooks(self):
+        """ Call the hooks registered by register_sparse_step_hook.
+        """
+        if len(self.sparse_opts) > 0:
+            for hook in self._sparse_step_hooks:
+                hook()
 
     def zero_grad(self):
         """ Setting the gradient to zero
@@ -117,6 +131,7 @@ class GSOptimizer():
                 optimizer.step(optimizer.lr)
             else:
                 optimizer.step()
+        self._run_sparse_step_hooks()
 
     def load_opt_state(self, path, device=None):
         """ Load the optimizer states
@@ -829,6 +844,11 @@ class GSgnnModel(GSgnnModelBase):    # pylint: disable=abstract-method
         self._optimizer = GSOptimizer(dense_opts=dense_opts,
                                       lm_opts=lm_opts,
                                       sparse_opts=sparse_opts)
+        if isinstance(self.node_input_encoder, GSNodeInputLayer):
+            # The sparse embedding rows cached by the input layer are stale after
+            # every sparse update.
+            self._optimizer.register_sparse_step_hook(
+                self.node_input_encoder.reset_sparse_emb_caches)
 
     def create_optimizer(self):
         """the optimizer
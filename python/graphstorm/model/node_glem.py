@@ -21,6 +21,7 @@ import torch as th
 import dgl
 
 from .gnn import GSOptimizer
+from .embed import GSNodeInputLayer
 from .node_gnn import GSgnnNodeModel, GSgnnNodeModelBase
 
 # GLEM supports configuring the parameter grouping of the following:
@@ -62,6 +63,8 @@ class GLEMOptimizer(GSOptimizer):
             all_opts += self.sparse_opts
         for optimizer in all_opts:
             optimizer.step()
+        if optimize_sparse_params:
+            self._run_sparse_step_hooks()
 
 class GLEM(GSgnnNodeModelBase):
     """
@@ -188,6 +191,11 @@ class GLEM(GSgnnNodeModelBase):
         self._optimizer = GLEMOptimizer(dense_opts=dense_opts,
                                       lm_opts=lm_opts,
                                       sparse_opts=sparse_opts)
+        if isinstance(self.lm.node_input_encoder, GSNodeInputLayer):
+            # The sparse embedding rows cached by the input layer are stale after
+            # every sparse update.
+            self._optimizer.register_sparse_step_hook(
+                self.lm.node_input_encoder.reset_sparse_emb_caches)
 
     def create_optimizer(self):
         """Create the optimizer that optimizes the model."""
@@ -43,6 +43,7 @@ from graphstorm.config.config import GRAPHSTORM_SAGEMAKER_TASK_TRACKER
 from graphstorm.config import BUILTIN_LP_DOT_DECODER
 from graphstorm.config import BUILTIN_LP_DISTMULT_DECODER
 from graphstorm.config.config import LINK_PREDICTION_MAJOR_EVAL_ETYPE_ALL
+from graphstorm.config.config import get_mttask_id
 
 def check_failure(config, field):
     has_error = False
@@ -238,6 +239,9 @@ def create_train_config(tmp_path, file_name):
         "lm_tune_lr": 0.0001,
         "sparse_optimizer_lr": 0.001,
         "use_node_embeddings": False,
+        "sparse_emb_cache_size": 1000,
+        "quantize_sparse_emb_cache": True,
+        "compile_input_proj": True,
         "use_self_loop": False,
         "use_early_stop": True,
         "save_model_path": os.path.join(tmp_path, "save"),
@@ -281,6 +285,9 @@ def create_train_config(tmp_path, file_name):
         "lm_tune_lr": 0.,
         "sparse_optimizer_lr": 0.,
         "use_node_embeddings": True,
+        "sparse_emb_cache_size": -1,
+        "quantize_sparse_emb_cache": "error",
+        "compile_input_proj": "error",
         "use_self_loop": "error",
         "eval_frequency": 1000,
         'save_model_frequency': 700,
@@ -322,6 +329,9 @@ def test_train_info():
         assert config.lm_tune_lr == 0.01
         assert config.sparse_optimizer_lr == 0.01
         assert config.use_node_embeddings == False
+        assert config.sparse_emb_cache_size == 0
+        assert config.quantize_sparse_emb_cache == False
+        assert config.compile_input_proj == False
         assert config.use_self_loop == True
         assert config.use_early_stop == False
 
@@ -339,6 +349,9 @@ def test_train_info():
         assert config.lm_tune_lr == 0.0001
         assert config.sparse_optimizer_lr == 0.001
         assert config.use_node_embeddings == False
+        assert config.sparse_emb_cache_size == 1000
+        assert config.quantize_sparse_emb_cache == True
+        assert config.compile_input_proj == True
         assert config.use_self_loop == False
         assert config.use_early_stop == True
         assert config.early_stop_burnin_rounds == 0
@@ -370,6 +383,9 @@ def test_train_info():
         check_failure(config, "lm_tune_lr")
         check_failure(config, "sparse_optimizer_lr")
         assert config.use_node_embeddings == True
+        check_failure(config, "sparse_emb_cache_size")
+        check_failure(config, "quantize_sparse_emb_cache")
+        check_failure(config, "compile_input_proj")
         check_failure(config, "use_self_loop")
         config._dropout = 1.0
         check_failure(config, "dropout")
@@ -1728,6 +1744,27 @@ def create_multi_task_config(tmp_path, file_name):
     with open(os.path.join(tmp_path, file_name+"_default.yaml"), "w") as f:
         yaml.dump(yaml_object, f)
 
+def test_get_mttask_id():
+    assert get_mttask_id(BUILTIN_TASK_NODE_CLASSIFICATION, ntype="a", label="l") == \
+        f"{BUILTIN_TASK_NODE_CLASSIFICATION}-a-l"
+    assert get_mttask_id(BUILTIN_TASK_EDGE_REGRESSION, etype=("a", "r", "b"), label="l") == \
+        f"{BUILTIN_TASK_EDGE_REGRESSION}-a_r_b-l"
+    assert get_mttask_id(BUILTIN_TASK_LINK_PREDICTION, etype="ALL_ETYPE") == \
+        f"{BUILTIN_TASK_LINK_PREDICTION}-ALL_ETYPE"
+    task_id = get_mttask_id(BUILTIN_TASK_LINK_PREDICTION,
+                            etype=[("a", "r0", "b"), ["a", "r1", "c"]])
+    assert task_id == f"{BUILTIN_TASK_LINK_PREDICTION}-a_r0_b__a_r1_c"
+    # The same inputs return the same cached task id object.
+    assert get_mttask_id(BUILTIN_TASK_LINK_PREDICTION,
+                         etype=[("a", "r0", "b"), ("a", "r1", "c")]) is task_id
+
+    has_error = False
+    try:
+        get_mttask_id(BUILTIN_TASK_LINK_PREDICTION, etype={"a": "b"})
+    except TypeError:
+        has_error = True
+    assert has_error
+
 def test_multi_task_config():
     with tempfile.TemporaryDirectory() as tmpdirname:
         create_multi_task_config(Path(tmpdirname), 'multi_task_test')
@@ -1890,6 +1927,7 @@ def test_multi_task_config():
         assert nfr_config.batch_size == 64
 
 if __name__ == '__main__':
+    test_get_mttask_id()
     test_multi_task_config()
     test_id_mapping_file()
     test_load_basic_info()
@@ -177,6 +177,89 @@ def test_input_layer3(dev):
     dgl.distributed.kvstore.close_kvstore()
 
 
+# In this case, node types with the same feature size are projected together.
+def test_input_layer_proj():
+    # initialize the torch distributed environment
+    th.distributed.init_process_group(backend='gloo',
+                                      init_method='tcp://127.0.0.1:23456',
+                                      rank=0,
+                                      world_size=1)
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        # get the test dummy distributed graph
+        g, _ = generate_dummy_dist_graph(tmpdirname)
+
+    feat_size = get_node_feat_size(g, 'feat')
+    layer = GSNodeEncoderInputLayer(g, feat_size, 2)
+    def check_embed(input_nodes):
+        node_feat = {ntype: g.nodes[ntype].data['feat'][input_nodes[ntype]] \
+            for ntype in g.ntypes}
+        embed = layer(node_feat, input_nodes)
+        assert list(embed.keys()) == list(input_nodes.keys())
+        for ntype in g.ntypes:
+            true_val = node_feat[ntype] @ layer.input_projs[ntype]
+            assert embed[ntype].shape == (len(input_nodes[ntype]), 2)
+            assert_almost_equal(embed[ntype].detach().numpy(),
+                                true_val.detach().numpy(), decimal=5)
+
+    check_embed({ntype: np.arange(10) for ntype in g.ntypes})
+    # The node types have different numbers of nodes.
+    check_embed({ntype: np.arange(10 - i * 3) for i, ntype in enumerate(g.ntypes)})
+    th.distributed.destroy_process_group()
+    dgl.distributed.kvstore.close_kvstore()
+
+# In this case, the sparse embeddings are looked up through the embedding cache.
+@pytest.mark.parametrize("dev", ['cpu','cuda:0'])
+@pytest.mark.parametrize("quantize", [False, True])
+def test_input_layer_sparse_cache(dev, quantize):
+    # initialize the torch distributed environment
+    th.distributed.init_process_group(backend='gloo',
+                                      init_method='tcp://127.0.0.1:23456',
+                                      rank=0,
+                                      world_size=1)
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        # get the test dummy distributed graph
+        g, _ = generate_dummy_dist_graph(tmpdirname)
+
+    feat_size = get_node_feat_size(g, {'n0' : ['feat']})
+    # The cache is smaller than the batch so that some nodes share a cache slot.
+    layer = GSNodeEncoderInputLayer(g, feat_size, 2, sparse_cache_size=4,
+                                    quantize_sparse_cache=quantize)
+    layer = layer.to(dev)
+    nn.init.eye_(layer.input_projs['n0'])
+    nn.init.eye_(layer.proj_matrix['n1'])
+    layer.eval()
+
+    input_nodes = {'n0': np.arange(10)}
+    node_feat = {'n0': g.nodes['n0'].data['feat'][input_nodes['n0']].to(dev)}
+    for nids in [np.arange(10), np.array([3, 7, 3, 11, 7]), np.arange(10)]:
+        input_nodes['n1'] = nids
+        node_embs = layer.sparse_embeds['n1'].weight[nids]
+        embed = layer(node_feat, dict(input_nodes))
+        # The INT8 cached rows lose precision.
+        assert_almost_equal(embed['n1'].detach().cpu().numpy(),
+                            node_embs.detach().cpu().numpy(),
+                            decimal=2 if quantize else 7)
+
+    # The cached rows are served until they are dropped, e.g., after a step of
+    # the sparse optimizer. The nodes map to different slots, so all are cached.
+    nids = np.arange(4)
+    input_nodes['n1'] = nids
+    old_embs = layer.sparse_embeds['n1'].weight[nids]
+    layer(node_feat, dict(input_nodes))
+    layer.sparse_embeds['n1'].weight[nids] = th.ones(len(nids), 2)
+    embed = layer(node_feat, dict(input_nodes))
+    assert_almost_equal(embed['n1'].detach().cpu().numpy(),
+                        old_embs.detach().cpu().numpy(), decimal=2 if quantize else 7)
+    layer.reset_sparse_emb_caches()
+    embed = layer(node_feat, dict(input_nodes))
+    assert_almost_equal(embed['n1'].detach().cpu().numpy(), np.ones((len(nids), 2)))
+
+    # Switching back to training mode drops the cached rows.
+    layer.train()
+    assert all(cache._data is None for cache in layer._sparse_emb_caches.values())
+    th.distributed.destroy_process_group()
+    dgl.distributed.kvstore.close_kvstore()
+
 @pytest.mark.parametrize("dev", ['cpu','cuda:0'])
 def test_compute_embed(dev):
     # initialize the torch distributed environment
@@ -677,6 +760,11 @@ if __name__ == '__main__':
     test_input_layer2()
     test_input_layer3('cpu')
     test_input_layer3('cuda:0')
+    test_input_layer_proj()
+    test_input_layer_sparse_cache('cpu', False)
+    test_input_layer_sparse_cache('cpu', True)
+    test_input_layer_sparse_cache('cuda:0', False)
+    test_input_layer_sparse_cache('cuda:0', True)
     test_compute_embed('cpu')
     test_compute_embed('cuda:0')
 
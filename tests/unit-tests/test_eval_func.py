@@ -13,12 +13,15 @@
     See the License for the specific language governing permissions and
     limitations under the License.
 """
+import pytest
 import numpy as np
 import torch as th
 
 from numpy.testing import assert_almost_equal
+from sklearn.metrics import roc_auc_score, precision_recall_curve, auc, classification_report
+from graphstorm.eval.eval_func import _torch_auroc, compute_binary_clf_curve, copy_to_host
 from graphstorm.eval.eval_func import compute_mse, compute_rmse, compute_roc_auc, eval_roc_auc
-from graphstorm.eval.eval_func import compute_f1_score, eval_acc
+from graphstorm.eval.eval_func import compute_f1_score, compute_per_class_f1_score, eval_acc
 from graphstorm.eval.eval_func import compute_precision_recall_auc, compute_per_class_roc_auc
 
 def test_compute_mse():
@@ -49,6 +52,80 @@ def test_compute_rmse():
     assert_almost_equal(rmse32, rmse_pred64)
     assert_almost_equal(rmse32, rmse_label64)
 
+def test_torch_auroc():
+    # Scores with ties, compared with sklearn.
+    preds = th.randint(0, 10, (200,)).float() / 10
+    labels = th.randint(0, 2, (200,))
+    labels[:2] = th.tensor([0, 1])
+    assert_almost_equal(_torch_auroc(preds, labels).item(),
+                        roc_auc_score(labels.numpy(), preds.numpy()))
+
+    # With sample weights.
+    weights = th.rand(200)
+    assert_almost_equal(_torch_auroc(preds, labels, weights).item(),
+                        roc_auc_score(labels.numpy(), preds.numpy(),
+                                      sample_weight=weights.numpy()))
+
+    # Batched over classes in shape (n_classes, n_samples).
+    preds = th.rand((3, 200))
+    labels = th.randint(0, 2, (3, 200))
+    labels[:, :2] = th.tensor([0, 1])
+    scores = _torch_auroc(preds, labels)
+    assert scores.shape == (3,)
+    for i in range(3):
+        assert_almost_equal(scores[i].item(),
+                            roc_auc_score(labels[i].numpy(), preds[i].numpy()))
+
+    # Only one class present.
+    try:
+        _torch_auroc(th.rand(10), th.ones(10))
+        error = False
+    except ValueError:
+        error = True
+    assert error
+
+def test_numba_multilabel_counts():
+    pytest.importorskip("numba")
+    from graphstorm.eval.numba_kernels import multilabel_counts
+    y_true = np.random.randint(0, 2, (200, 5)).astype(bool)
+    y_pred = np.random.randint(0, 2, (200, 5)).astype(bool)
+    # The kernel takes the indicators in shape (n_labels, n_samples).
+    tps, fps, fns = multilabel_counts(np.ascontiguousarray(y_true.T),
+                                      np.ascontiguousarray(y_pred.T))
+    np.testing.assert_equal(tps, np.sum(y_true & y_pred, axis=0))
+    np.testing.assert_equal(fps, np.sum(~y_true & y_pred, axis=0))
+    np.testing.assert_equal(fns, np.sum(y_true & ~y_pred, axis=0))
+
+def test_binary_clf_curve():
+    preds = th.rand(100, 2)
+    labels = th.randint(0, 2, (100,))
+    curve = compute_binary_clf_curve(preds, labels)
+    # The shared curve gives the same scores as computing it in each metric.
+    assert_almost_equal(compute_roc_auc(preds, labels, curve=curve),
+                        compute_roc_auc(preds, labels), decimal=6)
+    assert_almost_equal(compute_precision_recall_auc(preds, labels, curve=curve),
+                        compute_precision_recall_auc(preds, labels), decimal=6)
+    # Multi-class cases have no binary curve.
+    assert compute_binary_clf_curve(th.rand(100, 3), th.randint(0, 3, (100,))) is None
+
+def test_host_copy():
+    # The shared CPU copies give the same scores as copying in each metric.
+    preds = th.randint(0, 3, (100,))
+    labels = th.randint(0, 3, (100,))
+    host_copy = copy_to_host(preds, labels)
+    assert isinstance(host_copy[0], np.ndarray) and isinstance(host_copy[1], np.ndarray)
+    assert compute_f1_score(preds, labels, host_copy=host_copy) == \
+        compute_f1_score(preds, labels)
+    assert compute_per_class_f1_score(preds, labels, host_copy=host_copy) == \
+        compute_per_class_f1_score(preds, labels)
+
+    preds = th.rand(100, 3)
+    preds = preds / preds.sum(dim=1, keepdim=True)
+    labels = th.randint(0, 3, (100,))
+    host_copy = copy_to_host(preds, labels)
+    assert_almost_equal(compute_roc_auc(preds, labels, host_copy=host_copy),
+                        compute_roc_auc(preds, labels), decimal=6)
+
 def test_eval_roc_auc():
     # GraphStorm inputs: preds are logits>= 2D, and labels are all 1D list.
 
@@ -239,6 +316,29 @@ def test_compute_f1_score():
     assert error_score_2 == -1
     assert f1_score == 1.0
 
+def test_compute_per_class_f1_score():
+    # Multi-class labels, compared with sklearn. Class 4 is only in the predictions.
+    preds = th.randint(0, 5, (200,))
+    targets = th.randint(0, 4, (200,))
+    report = compute_per_class_f1_score(preds, targets)
+    expected = classification_report(targets.numpy(), preds.numpy(),
+                                     output_dict=True, zero_division=0)
+    for key in ["0", "1", "2", "3", "4", "macro avg", "weighted avg"]:
+        for metric in ["precision", "recall", "f1-score", "support"]:
+            assert_almost_equal(report[key][metric], expected[key][metric])
+    assert_almost_equal(report["accuracy"], expected["accuracy"])
+    assert_almost_equal(compute_f1_score(preds, targets), expected["macro avg"]["f1-score"])
+
+    # Multi-label indicators.
+    preds = th.randint(0, 2, (200, 3))
+    targets = th.randint(0, 2, (200, 3))
+    report = compute_per_class_f1_score(preds, targets)
+    expected = classification_report(targets.numpy(), preds.numpy(),
+                                     output_dict=True, zero_division=0)
+    for key in ["0", "1", "2", "micro avg", "macro avg", "weighted avg"]:
+        for metric in ["precision", "recall", "f1-score", "support"]:
+            assert_almost_equal(report[key][metric], expected[key][metric])
+
 def test_eval_acc():
     # GraphStorm inputs: 1D in 0s and 1s, or nD in logits, Labels 1D
     
@@ -312,6 +412,24 @@ def test_compute_precision_recall_auc():
     assert pr_auc_2 == 0.9
     assert bin_pr_auc == 0.9
 
+def test_compute_precision_recall_auc_binary():
+    # Scores with ties and sample weights, compared with sklearn.
+    preds = th.randint(0, 10, (200, 2)).float() / 10
+    labels = th.randint(0, 2, (200,))
+    weights = th.randint(0, 3, (200,)).float()
+    precision, recall, _ = precision_recall_curve(labels.numpy(), preds[:, 1].numpy(),
+                                                  sample_weight=weights.numpy())
+    assert_almost_equal(compute_precision_recall_auc(preds, labels, weights),
+                        auc(recall, precision))
+    # The sorted curve is shared with roc_auc.
+    assert_almost_equal(compute_roc_auc(preds, labels, weights),
+                        roc_auc_score(labels.numpy(), preds[:, 1].numpy(),
+                                      sample_weight=weights.numpy()))
+
+    # Labels other than 0s and 1s are not supported.
+    with pytest.raises(ValueError):
+        compute_precision_recall_auc(th.rand(10), th.arange(10) % 3)
+
 def test_compute_per_class_roc_auc():
     # GraphStorm inputs: preds are 1D or 2D, and labels are all 1D list.
 
@@ -381,12 +499,18 @@ if __name__ == '__main__':
     test_compute_mse()
     test_compute_rmse()
 
+    test_binary_clf_curve()
+    test_host_copy()
+    test_torch_auroc()
+    test_numba_multilabel_counts()
     test_eval_roc_auc()
     test_compute_roc_auc()
     test_compute_per_class_roc_auc()
 
     test_compute_f1_score()
+    test_compute_per_class_f1_score()
 
     test_eval_acc()
 
     test_compute_precision_recall_auc()
+    test_compute_precision_recall_auc_binary()
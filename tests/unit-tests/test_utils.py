@@ -40,7 +40,8 @@ from graphstorm import get_node_feat_size
 from graphstorm.model.gnn_encoder_base import prepare_for_wholegraph
 
 from data_utils import generate_dummy_dist_graph
-from graphstorm.eval.utils import gen_mrr_score
+from graphstorm.eval.utils import gen_mrr_score, calc_ranking
+from graphstorm.eval.utils import calc_distmult_neg_tail_score, calc_distmult_neg_head_score
 from graphstorm.utils import setup_device, get_graph_name
 
 from graphstorm.gconstruct.file_io import stream_dist_tensors_to_hdf5
@@ -776,6 +777,38 @@ def test_gen_mrr_score():
 
     assert th.isclose(metrics['mrr'], metrics_opti['mrr'])  # Default tolerance: 1e-08
 
+def test_calc_ranking():
+    pos_score = th.tensor([0.9, 0.5, 0.1])
+    neg_score = th.tensor([[0.1, 0.2, 0.3],
+                           [0.6, 0.4, 0.7],
+                           [0.2, 0.3, 0.4]])
+    assert th.equal(calc_ranking(pos_score, neg_score), th.tensor([1, 3, 4]))
+
+    # Negative scores tied with the positive score are ranked before it,
+    # so a model that gives all candidates the same score gets the worst ranking.
+    pos_score = th.ones(4)
+    neg_score = th.ones(4, 5)
+    assert th.equal(calc_ranking(pos_score, neg_score), th.full((4,), 6))
+    neg_score = th.tensor([[1., 0., 0.], [2., 1., 0.], [0., 0., 0.], [1., 1., 1.]])
+    assert th.equal(calc_ranking(pos_score, neg_score), th.tensor([2, 3, 1, 4]))
+
+def test_calc_distmult_neg_score():
+    num_chunks, chunk_size, neg_sample_size, hidden_dim = 2, 3, 4, 5
+    pos = th.rand(num_chunks * chunk_size, hidden_dim)
+    neg = th.rand(num_chunks * neg_sample_size, hidden_dim)
+    # One relation embedding shared by all edges, or one per edge.
+    for r_emb in [th.rand(hidden_dim), th.rand(1, hidden_dim),
+                  th.rand(num_chunks * chunk_size, hidden_dim)]:
+        true_score = th.bmm(
+            (pos * r_emb).reshape(num_chunks, chunk_size, hidden_dim),
+            neg.reshape(num_chunks, neg_sample_size, hidden_dim).transpose(1, 2))
+        score = calc_distmult_neg_tail_score(pos, neg, r_emb, num_chunks, chunk_size,
+                                             neg_sample_size)
+        assert_almost_equal(score.numpy(), true_score.numpy(), decimal=5)
+        score = calc_distmult_neg_head_score(neg, pos, r_emb, num_chunks, chunk_size,
+                                             neg_sample_size)
+        assert_almost_equal(score.numpy(), true_score.numpy(), decimal=5)
+
 def test_stream_dist_tensors_to_hdf5():
     with tempfile.TemporaryDirectory() as tmpdirname:
         # get the test dummy distributed graph
@@ -1174,6 +1207,8 @@ if __name__ == '__main__':
     test_remove_saved_models()
     test_topklist()
     test_gen_mrr_score()
+    test_calc_ranking()
+    test_calc_distmult_neg_score()
 
     test_stream_dist_tensors_to_hdf5()
     test_prepare_for_wholegraph()